@@ -0,0 +1,39 @@
+"""Add trigram search index on issues title/description
+
+Revision ID: a41c25de9b37
+Revises: 8fcfff124abe
+Create Date: 2026-08-27 10:15:02.118437
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a41c25de9b37'
+down_revision: Union[str, None] = '8fcfff124abe'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # The issue search endpoint runs an unanchored ILIKE over
+    # title || ' ' || coalesce(description, ''), which forces a full scan
+    # of every issue without index support. A pg_trgm GIN index over the
+    # same expression lets Postgres satisfy the ILIKE from the index, so
+    # cost scales with the result size instead of the table size.
+    # Both statements are Postgres-only; other backends (e.g. the SQLite
+    # test database) keep the plain scan.
+    if op.get_bind().dialect.name == 'postgresql':
+        op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+        op.execute(
+            "CREATE INDEX issues_trgm_idx ON issues "
+            "USING gin ((title || ' ' || coalesce(description, '')) gin_trgm_ops)"
+        )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name == 'postgresql':
+        op.execute('DROP INDEX IF EXISTS issues_trgm_idx')
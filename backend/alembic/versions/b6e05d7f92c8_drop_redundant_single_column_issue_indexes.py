@@ -0,0 +1,34 @@
+"""Drop redundant single-column status/priority indexes on issues
+
+Revision ID: b6e05d7f92c8
+Revises: f4b8a92d31c5
+Create Date: 2026-08-27 17:55:02.664190
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b6e05d7f92c8'
+down_revision: Union[str, None] = 'f4b8a92d31c5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Every status/priority filter in the app also filters on project_id,
+    # and the composite indexes (project_id, status, created_at DESC) /
+    # (project_id, priority, created_at DESC) lead with it. The lone
+    # single-column indexes only added write amplification per
+    # insert/update without serving any query the planner couldn't serve
+    # better from the composites.
+    op.drop_index('ix_issues_status', table_name='issues')
+    op.drop_index('ix_issues_priority', table_name='issues')
+
+
+def downgrade() -> None:
+    op.create_index('ix_issues_status', 'issues', ['status'])
+    op.create_index('ix_issues_priority', 'issues', ['priority'])
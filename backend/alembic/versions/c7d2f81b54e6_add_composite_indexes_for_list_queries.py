@@ -0,0 +1,57 @@
+"""Add composite indexes matching the list query shapes
+
+Revision ID: c7d2f81b54e6
+Revises: a41c25de9b37
+Create Date: 2026-08-27 14:42:51.902113
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c7d2f81b54e6'
+down_revision: Union[str, None] = 'a41c25de9b37'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # list_issues always filters on project_id, optionally narrows by
+    # status/priority/assignee, and orders by created_at desc. These
+    # composite indexes match those exact shapes so the database can walk
+    # an index in output order and stop at the page limit, instead of a
+    # scan + sort per request. The assignee index is partial - most
+    # issues are unassigned, so excluding NULLs keeps it small.
+    op.create_index(
+        'ix_issues_project_status_created',
+        'issues',
+        ['project_id', 'status', sa.text('created_at DESC')],
+    )
+    op.create_index(
+        'ix_issues_project_priority_created',
+        'issues',
+        ['project_id', 'priority', sa.text('created_at DESC')],
+    )
+    op.create_index(
+        'ix_issues_project_assignee_created',
+        'issues',
+        ['project_id', 'assignee_id', sa.text('created_at DESC')],
+        postgresql_where=sa.text('assignee_id IS NOT NULL'),
+        sqlite_where=sa.text('assignee_id IS NOT NULL'),
+    )
+    # list_comments filters by issue_id and orders by created_at asc
+    op.create_index(
+        'ix_comments_issue_created',
+        'comments',
+        ['issue_id', 'created_at'],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_comments_issue_created', table_name='comments')
+    op.drop_index('ix_issues_project_assignee_created', table_name='issues')
+    op.drop_index('ix_issues_project_priority_created', table_name='issues')
+    op.drop_index('ix_issues_project_status_created', table_name='issues')
@@ -0,0 +1,43 @@
+"""Bound users column lengths to match schema-level limits
+
+Revision ID: d2a7c41e86f3
+Revises: b6e05d7f92c8
+Create Date: 2026-08-27 19:12:40.118264
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd2a7c41e86f3'
+down_revision: Union[str, None] = 'b6e05d7f92c8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Cap the users columns at the limits the Pydantic schemas already
+    # enforce (name <= 100, email <= 254 per RFC) plus Argon2id hash
+    # output with headroom, instead of unbounded VARCHAR. On Postgres
+    # text and varchar(n) store identically, so this is defense in depth
+    # at the database layer rather than a layout win - nothing oversized
+    # can land in the table even through a path that skips validation.
+    # Widening VARCHAR is metadata-only on Postgres; no table rewrite.
+    op.alter_column('users', 'name', type_=sa.String(100),
+                    existing_nullable=False)
+    op.alter_column('users', 'email', type_=sa.String(254),
+                    existing_nullable=False)
+    op.alter_column('users', 'password_hash', type_=sa.String(128),
+                    existing_nullable=False)
+
+
+def downgrade() -> None:
+    op.alter_column('users', 'password_hash', type_=sa.String(),
+                    existing_nullable=False)
+    op.alter_column('users', 'email', type_=sa.String(),
+                    existing_nullable=False)
+    op.alter_column('users', 'name', type_=sa.String(),
+                    existing_nullable=False)
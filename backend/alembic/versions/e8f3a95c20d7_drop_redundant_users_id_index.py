@@ -0,0 +1,31 @@
+"""Drop redundant ix_users_id duplicating the primary key index
+
+Revision ID: e8f3a95c20d7
+Revises: d2a7c41e86f3
+Create Date: 2026-08-27 19:41:17.530882
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e8f3a95c20d7'
+down_revision: Union[str, None] = 'd2a7c41e86f3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # The primary key already maintains a unique index on users.id;
+    # ix_users_id was a second, non-unique index on the same column.
+    # Every signup and rehash-on-login updated both for zero read
+    # benefit. ix_users_email stays: it IS the unique index enforcing
+    # the email constraint, not a duplicate of one.
+    op.drop_index('ix_users_id', table_name='users')
+
+
+def downgrade() -> None:
+    op.create_index(op.f('ix_users_id'), 'users', ['id'], unique=False)
@@ -0,0 +1,33 @@
+"""Add reversed composite index on project_members
+
+Revision ID: e91b3c47a8d2
+Revises: c7d2f81b54e6
+Create Date: 2026-08-27 16:05:37.441820
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e91b3c47a8d2'
+down_revision: Union[str, None] = 'c7d2f81b54e6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # The composite PK indexes (project_id, user_id), so list_projects'
+    # "WHERE user_id = ?" join cannot use it efficiently. This reversed
+    # index turns that lookup into a direct index range scan.
+    op.create_index(
+        'ix_project_members_user_project',
+        'project_members',
+        ['user_id', 'project_id'],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_project_members_user_project', table_name='project_members')
@@ -0,0 +1,36 @@
+"""Carry role in the reverse membership index so authz probes are index-only
+
+Revision ID: f17d6b84c3a9
+Revises: e8f3a95c20d7
+Create Date: 2026-08-27 19:58:33.207415
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f17d6b84c3a9'
+down_revision: Union[str, None] = 'e8f3a95c20d7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # The role-cache miss path runs SELECT role FROM project_members
+    # WHERE user_id = ? AND project_id = ? on nearly every request.
+    # With role as a trailing column, Postgres answers it from the index
+    # alone (index-only scan) instead of following the tuple pointer
+    # into the heap. role is 'member'/'maintainer' - a handful of bytes
+    # per entry, cheap to carry.
+    op.drop_index('ix_project_members_user_project', table_name='project_members')
+    op.create_index('ix_project_members_user_project', 'project_members',
+                    ['user_id', 'project_id', 'role'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_project_members_user_project', table_name='project_members')
+    op.create_index('ix_project_members_user_project', 'project_members',
+                    ['user_id', 'project_id'])
@@ -0,0 +1,96 @@
+"""Replace native enum columns with VARCHAR + CHECK constraints
+
+Revision ID: f4b8a92d31c5
+Revises: e91b3c47a8d2
+Create Date: 2026-08-27 17:28:14.118276
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f4b8a92d31c5'
+down_revision: Union[str, None] = 'e91b3c47a8d2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Native Postgres enum types make every value change an ALTER TYPE
+    # and add an OID indirection to indexes; a VARCHAR with a CHECK
+    # constraint performs identically and migrates with a constraint
+    # swap. Stored values move from enum member names (e.g. 'OPEN') to
+    # the lowercase values the application uses (e.g. 'open').
+    # Postgres-only: SQLite test databases are built by create_all from
+    # the models, which already declare String + CheckConstraint.
+    bind = op.get_bind()
+    if bind.dialect.name != 'postgresql':
+        return
+
+    op.execute(
+        "ALTER TABLE project_members ALTER COLUMN role "
+        "TYPE varchar(16) USING lower(role::text)"
+    )
+    op.execute(
+        "ALTER TABLE issues ALTER COLUMN status "
+        "TYPE varchar(16) USING lower(status::text)"
+    )
+    op.execute(
+        "ALTER TABLE issues ALTER COLUMN priority "
+        "TYPE varchar(16) USING lower(priority::text)"
+    )
+
+    op.execute("DROP TYPE IF EXISTS projectrole")
+    op.execute("DROP TYPE IF EXISTS issuestatus")
+    op.execute("DROP TYPE IF EXISTS issuepriority")
+
+    op.create_check_constraint(
+        'ck_project_members_role', 'project_members',
+        "role IN ('member', 'maintainer')",
+    )
+    op.create_check_constraint(
+        'ck_issues_status', 'issues',
+        "status IN ('open', 'in_progress', 'resolved', 'closed')",
+    )
+    op.create_check_constraint(
+        'ck_issues_priority', 'issues',
+        "priority IN ('low', 'medium', 'high', 'critical')",
+    )
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name != 'postgresql':
+        return
+
+    op.drop_constraint('ck_issues_priority', 'issues')
+    op.drop_constraint('ck_issues_status', 'issues')
+    op.drop_constraint('ck_project_members_role', 'project_members')
+
+    op.execute(
+        "CREATE TYPE projectrole AS ENUM ('MEMBER', 'MAINTAINER')"
+    )
+    op.execute(
+        "CREATE TYPE issuestatus AS ENUM "
+        "('OPEN', 'IN_PROGRESS', 'RESOLVED', 'CLOSED')"
+    )
+    op.execute(
+        "CREATE TYPE issuepriority AS ENUM "
+        "('LOW', 'MEDIUM', 'HIGH', 'CRITICAL')"
+    )
+
+    op.execute(
+        "ALTER TABLE project_members ALTER COLUMN role "
+        "TYPE projectrole USING upper(role)::projectrole"
+    )
+    op.execute(
+        "ALTER TABLE issues ALTER COLUMN status "
+        "TYPE issuestatus USING upper(status)::issuestatus"
+    )
+    op.execute(
+        "ALTER TABLE issues ALTER COLUMN priority "
+        "TYPE issuepriority USING upper(priority)::issuepriority"
+    )
@@ -7,16 +7,30 @@ Endpoints:
     GET  /api/me          - Get current user profile
 """
 
+import secrets
 from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy import insert
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 from app.database import get_db
 from app.models.user import User
 from app.schemas.user import UserCreate, UserLogin, UserResponse, TokenResponse
-from app.core.security import get_password_hash, verify_password, create_access_token
-from app.core.deps import get_current_user
+from app.core.security import (
+    get_password_hash,
+    verify_password,
+    create_access_token,
+    password_needs_rehash
+)
+from app.core.deps import get_current_user, invalidate_email_cache, lookup_user_by_email
 
 router = APIRouter()
 
+# Hash of a random throwaway password, verified whenever a login email
+# doesn't match any user. Without it, /login returns fast for unknown
+# emails (no hash computed) and slow for known ones - a timing oracle
+# that lets attackers enumerate registered addresses.
+_DUMMY_PASSWORD_HASH = get_password_hash(secrets.token_urlsafe(32))
+
 
 @router.post("/signup", response_model=UserResponse, status_code=status.HTTP_201_CREATED)
 def signup(user_data: UserCreate, db: Session = Depends(get_db)):
@@ -55,25 +69,28 @@ def signup(user_data: UserCreate, db: Session = Depends(get_db)):
             "created_at": "2024-01-15T10:30:00Z"
         }
     """
-    # Check if user already exists
-    existing_user = db.query(User).filter(User.email == user_data.email).first()
-    if existing_user:
+    # Create new user with hashed password. INSERT ... RETURNING brings the
+    # server-generated id/created_at back in the same round-trip, instead
+    # of the extra SELECT that db.refresh() would issue. Duplicate emails
+    # are left to the UNIQUE(email) constraint rather than a preflight
+    # SELECT - the constraint has to be the authority anyway (the SELECT
+    # can't see concurrent signups), and the happy path saves a round-trip
+    try:
+        db_user = db.execute(
+            insert(User).values(
+                name=user_data.name,
+                email=user_data.email,
+                password_hash=get_password_hash(user_data.password)  # Hash password!
+            ).returning(User)
+        ).scalar_one()
+        db.commit()
+    except IntegrityError:
+        db.rollback()
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Email already registered"
         )
-    
-    # Create new user with hashed password
-    db_user = User(
-        name=user_data.name,
-        email=user_data.email,
-        password_hash=get_password_hash(user_data.password)  # Hash password!
-    )
-    
-    db.add(db_user)
-    db.commit()
-    db.refresh(db_user)  # Get the ID and created_at from database
-    
+
     return db_user
 
 
@@ -115,17 +132,37 @@ def login(credentials: UserLogin, db: Session = Depends(get_db)):
         1. Store token in memory or sessionStorage
         2. Include in requests: Authorization: Bearer <token>
     """
-    # Find user by email
-    user = db.query(User).filter(User.email == credentials.email).first()
-    
-    # Verify user exists and password is correct
-    if not user or not verify_password(credentials.password, user.password_hash):
+    # Find user by email (short TTL cache - repeat logins from the same
+    # account skip the SELECT)
+    user = lookup_user_by_email(db, credentials.email)
+
+    # Always run the (expensive, constant-time) hash verification - against
+    # a dummy hash when the email is unknown - so both failure branches
+    # cost the same and return the same 401
+    password_ok = verify_password(
+        credentials.password,
+        user.password_hash if user else _DUMMY_PASSWORD_HASH
+    )
+
+    if not user or not password_ok:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect email or password",
             headers={"WWW-Authenticate": "Bearer"},
         )
     
+    # Opportunistically upgrade legacy hashes (e.g. bcrypt) to Argon2id -
+    # login is the only time we have the plain password available. A
+    # cache hit hands back an instance detached from an earlier request's
+    # session, so merge it into this one before writing (assigning to the
+    # detached object would flush nothing), and drop the cache entry so
+    # later logins read the upgraded row instead of re-rehashing.
+    if password_needs_rehash(user.password_hash):
+        user = db.merge(user)
+        user.password_hash = get_password_hash(credentials.password)
+        db.commit()
+        invalidate_email_cache(user.email)
+
     # Create JWT token with user email as subject
     access_token = create_access_token(data={"sub": user.email})
     
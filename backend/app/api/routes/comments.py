@@ -7,7 +7,10 @@ Endpoints:
 """
 
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import insert, text
 from sqlalchemy.orm import Session
+from sqlalchemy.orm.attributes import set_committed_value
 from typing import List
 from app.database import get_db
 from app.models.user import User
@@ -15,12 +18,15 @@ from app.models.issue import Issue
 from app.models.comment import Comment
 from app.models.project import ProjectMember
 from app.schemas.comment import CommentCreate, CommentResponse
-from app.core.deps import get_current_user
+from app.core.deps import get_current_user, get_issue_and_membership
+from app.core.loaders import UserLoader
 
 router = APIRouter()
 
 
-@router.get("/issues/{issue_id}/comments", response_model=List[CommentResponse])
+# response_model=None: responses are built with from_orm_fast from trusted
+# DB rows and serialized straight through orjson, skipping revalidation
+@router.get("/issues/{issue_id}/comments", response_model=None)
 def list_comments(
     issue_id: int,
     current_user: User = Depends(get_current_user),
@@ -75,33 +81,21 @@ def list_comments(
             }
         ]
     """
-    # Get issue
-    issue = db.query(Issue).filter(Issue.id == issue_id).first()
-    
-    if not issue:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Issue not found"
-        )
-    
-    # Check if user is a member of the issue's project
-    is_member = db.query(ProjectMember).filter(
-        ProjectMember.project_id == issue.project_id,
-        ProjectMember.user_id == current_user.id
-    ).first()
-    
-    if not is_member:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="You do not have access to this issue"
-        )
-    
+    # Fetch issue + membership check in one JOIN (404/403 raised inside)
+    issue, _ = get_issue_and_membership(db, issue_id, current_user.id)
+
     # Get comments ordered by creation time (oldest first, like a conversation)
     comments = db.query(Comment).filter(
         Comment.issue_id == issue_id
     ).order_by(Comment.created_at.asc()).all()
-    
-    return comments
+
+    # Batch-attach authors: CommentResponse embeds the author user, and one
+    # IN (...) query covers all distinct authors in the thread
+    UserLoader(db).attach_comment_authors(comments)
+
+    return ORJSONResponse(
+        [CommentResponse.from_orm_fast(comment).model_dump() for comment in comments]
+    )
 
 
 @router.post("/issues/{issue_id}/comments", response_model=CommentResponse, status_code=status.HTTP_201_CREATED)
@@ -150,36 +144,29 @@ def create_comment(
             "created_at": "2024-01-15T16:45:00Z"
         }
     """
-    # Get issue
-    issue = db.query(Issue).filter(Issue.id == issue_id).first()
-    
-    if not issue:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Issue not found"
-        )
-    
-    # Check if user is a member of the issue's project
-    is_member = db.query(ProjectMember).filter(
-        ProjectMember.project_id == issue.project_id,
-        ProjectMember.user_id == current_user.id
-    ).first()
-    
-    if not is_member:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="You do not have access to this issue"
-        )
-    
-    # Create comment
-    db_comment = Comment(
-        issue_id=issue_id,
-        author_id=current_user.id,
-        body=comment_data.body
-    )
-    
-    db.add(db_comment)
+    # Fetch issue + membership check in one JOIN (404/403 raised inside)
+    issue, _ = get_issue_and_membership(db, issue_id, current_user.id)
+
+    # Comments are low-stakes writes: losing one to a crash in the last
+    # few hundred ms is acceptable, so on Postgres we skip the synchronous
+    # WAL flush for this transaction only. SET LOCAL reverts at commit and
+    # never affects other requests on the pooled connection.
+    if db.get_bind().dialect.name == "postgresql":
+        db.execute(text("SET LOCAL synchronous_commit = off"))
+
+    # Create comment. INSERT ... RETURNING brings back the server-generated
+    # id/created_at in the same round-trip, instead of the extra SELECT
+    # that db.refresh() would issue
+    db_comment = db.execute(
+        insert(Comment).values(
+            issue_id=issue_id,
+            author_id=current_user.id,
+            body=comment_data.body
+        ).returning(Comment)
+    ).scalar_one()
     db.commit()
-    db.refresh(db_comment)
-    
+
+    # The author is the caller - attach without another query
+    set_committed_value(db_comment, "author", current_user)
+
     return db_comment
\ No newline at end of file
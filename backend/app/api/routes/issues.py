@@ -9,21 +9,50 @@ Endpoints:
     DELETE /api/issues/{issue_id}            - Delete an issue
 """
 
+import base64
 from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy.orm import Session
-from sqlalchemy import or_, and_
+from fastapi.responses import ORJSONResponse
+from sqlalchemy.orm import Session, raiseload
+from sqlalchemy.orm.attributes import set_committed_value
+from sqlalchemy import and_, case, func, insert
 from typing import Optional, List
 from app.database import get_db
 from app.models.user import User
 from app.models.issue import Issue, IssueStatus, IssuePriority
 from app.models.project import ProjectMember, ProjectRole
-from app.schemas.issue import IssueCreate, IssueUpdate, IssueResponse, IssueListResponse
-from app.core.deps import get_current_user, get_project_member
+from app.schemas.issue import IssueCreate, IssueUpdate, IssueResponse, serialize_issue_list
+from app.core.deps import get_current_user, get_project_member, get_issue_and_membership
+from app.core.loaders import UserLoader, issue_detail_load_options
 
 router = APIRouter()
 
 
-@router.get("/projects/{project_id}/issues", response_model=IssueListResponse)
+def _encode_cursor(issue_id: int) -> str:
+    """Encode a keyset position (last issue id on the page) as an opaque token."""
+    return base64.urlsafe_b64encode(str(issue_id).encode("ascii")).decode("ascii")
+
+
+def _decode_cursor(cursor: str) -> int:
+    """
+    Decode a cursor token back into its keyset position.
+
+    Raises:
+        HTTPException 400: If the cursor is malformed
+    """
+    try:
+        return int(base64.urlsafe_b64decode(cursor.encode("ascii")))
+    except (ValueError, UnicodeDecodeError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor"
+        )
+
+
+# response_model=None: the page is built as plain dicts from trusted DB
+# rows (serialize_issue_list) and serialized straight through orjson,
+# skipping the response-validation pass. None-valued optionals are omitted,
+# keeping the old payload shape (no null description/assignee/total keys).
+@router.get("/projects/{project_id}/issues", response_model=None)
 def list_issues(
     project_id: int,
     q: Optional[str] = Query(None, description="Search in title and description"),
@@ -31,9 +60,11 @@ def list_issues(
     priority: Optional[IssuePriority] = Query(None, description="Filter by priority"),
     assignee_id: Optional[int] = Query(None, description="Filter by assignee user ID"),
     sort: Optional[str] = Query("created_at", description="Sort by: created_at, priority, status, updated_at"),
-    page: int = Query(1, ge=1, description="Page number"),
+    cursor: Optional[str] = Query(None, description="Keyset cursor from a previous response (created_at sort only)"),
+    include_total: bool = Query(False, description="Include total count (runs an extra COUNT query)"),
+    page: int = Query(1, ge=1, description="Page number (fallback for non-created_at sorts)"),
     page_size: int = Query(20, ge=1, le=100, description="Items per page"),
-    member: ProjectMember = Depends(get_project_member),
+    member: ProjectRole = Depends(get_project_member),
     db: Session = Depends(get_db)
 ):
     """
@@ -47,7 +78,10 @@ def list_issues(
         - priority: Filter by priority (low, medium, high, critical)
         - assignee_id: Filter by assigned user ID
         - sort: Sort field (created_at, priority, status, updated_at)
-        - page: Page number (default: 1)
+        - cursor: Opaque keyset cursor from a previous response's next_cursor
+          (only used with the default created_at sort)
+        - include_total: Set true to include a total count (extra COUNT query)
+        - page: Page number (default: 1, used for non-created_at sorts)
         - page_size: Items per page (default: 20, max: 100)
         
     Args:
@@ -84,15 +118,23 @@ def list_issues(
         }
     """
     # Start with base query
-    query = db.query(Issue).filter(Issue.project_id == project_id)
+    # reporter/assignee are batch-attached after the fetch (see UserLoader
+    # below); raiseload("*") makes any accidental lazy access fail loudly.
+    # description is a deferred column - the list view only shows a
+    # snippet, so select a 200-char preview expression instead of hauling
+    # the full text for every row.
+    description_preview = func.substr(Issue.description, 1, 200)
+    query = db.query(Issue, description_preview).options(
+        raiseload("*")
+    ).filter(Issue.project_id == project_id)
     
     # Apply search filter (search in title and description)
+    # Match against the same concatenated expression the trigram GIN index
+    # (issues_trgm_idx) is built on, so Postgres answers the unanchored
+    # ILIKE from the index instead of scanning every issue in the project
     if q:
-        search_filter = or_(
-            Issue.title.ilike(f"%{q}%"),
-            Issue.description.ilike(f"%{q}%")
-        )
-        query = query.filter(search_filter)
+        haystack = Issue.title + " " + func.coalesce(Issue.description, "")
+        query = query.filter(haystack.ilike(f"%{q}%"))
     
     # Apply status filter
     if status:
@@ -106,36 +148,64 @@ def list_issues(
     if assignee_id:
         query = query.filter(Issue.assignee_id == assignee_id)
     
-    # Apply sorting
+    # Total is opt-in: COUNT(*) scans the whole filtered set, and the UI
+    # only needs "is there a next page", which the cursor answers for free
+    total = query.count() if include_total else None
+
+    next_cursor = None
     if sort == "created_at":
-        query = query.order_by(Issue.created_at.desc())
-    elif sort == "updated_at":
-        query = query.order_by(Issue.updated_at.desc())
-    elif sort == "priority":
-        # Sort by priority: critical > high > medium > low
-        priority_order = {
-            IssuePriority.CRITICAL: 0,
-            IssuePriority.HIGH: 1,
-            IssuePriority.MEDIUM: 2,
-            IssuePriority.LOW: 3
-        }
-        query = query.order_by(Issue.priority)
-    elif sort == "status":
-        query = query.order_by(Issue.status)
-    
-    # Get total count before pagination
-    total = query.count()
-    
-    # Apply pagination
-    offset = (page - 1) * page_size
-    issues = query.offset(offset).limit(page_size).all()
-    
-    return {
-        "issues": issues,
-        "total": total,
-        "page": page,
-        "page_size": page_size
-    }
+        # Keyset pagination - O(log n) regardless of depth, unlike OFFSET
+        # which fetches and discards all skipped rows. Ids are assigned
+        # monotonically and created_at is server-now at insert, so the
+        # (created_at desc, id desc) order coincides with id desc and the
+        # id alone is an exact keyset (timestamp comparisons are also
+        # unreliable for ties across backends). Fetch one extra row to
+        # know whether a next page exists.
+        query = query.order_by(Issue.created_at.desc(), Issue.id.desc())
+        if cursor:
+            query = query.filter(Issue.id < _decode_cursor(cursor))
+        rows = query.limit(page_size + 1).all()
+        if len(rows) > page_size:
+            rows = rows[:page_size]
+            next_cursor = _encode_cursor(rows[-1][0].id)
+    else:
+        # Other sort orders have no unique keyset column - keep OFFSET
+        if sort == "updated_at":
+            query = query.order_by(Issue.updated_at.desc())
+        elif sort == "priority":
+            # Rank priorities semantically (critical > high > medium > low)
+            # in SQL - a plain order_by(Issue.priority) sorts the enum
+            # labels alphabetically, which is wrong
+            priority_rank = case(
+                (Issue.priority == IssuePriority.CRITICAL, 0),
+                (Issue.priority == IssuePriority.HIGH, 1),
+                (Issue.priority == IssuePriority.MEDIUM, 2),
+                else_=3  # LOW
+            )
+            query = query.order_by(priority_rank.asc(), Issue.created_at.desc())
+        elif sort == "status":
+            query = query.order_by(Issue.status)
+        offset = (page - 1) * page_size
+        rows = query.offset(offset).limit(page_size).all()
+
+    # Populate the deferred description with the preview so serialization
+    # doesn't fall back to loading the full text per row
+    issues = []
+    for issue, preview in rows:
+        set_committed_value(issue, "description", preview)
+        issues.append(issue)
+
+    # Batch-attach reporter/assignee: one IN (...) query for the distinct
+    # users on this page, instead of joining their columns onto every row
+    UserLoader(db).attach_issue_users(issues)
+
+    return ORJSONResponse(serialize_issue_list(
+        issues,
+        total=total,
+        page=page,
+        page_size=page_size,
+        next_cursor=next_cursor,
+    ))
 
 
 @router.post("/projects/{project_id}/issues", response_model=IssueResponse, status_code=status.HTTP_201_CREATED)
@@ -143,7 +213,7 @@ def create_issue(
     project_id: int,
     issue_data: IssueCreate,
     current_user: User = Depends(get_current_user),
-    member: ProjectMember = Depends(get_project_member),
+    member: ProjectRole = Depends(get_project_member),
     db: Session = Depends(get_db)
 ):
     """
@@ -206,25 +276,38 @@ def create_issue(
                 detail="Assignee must be a project member"
             )
     
-    # Create issue
-    db_issue = Issue(
-        project_id=project_id,
-        title=issue_data.title,
-        description=issue_data.description,
-        priority=issue_data.priority,
-        reporter_id=current_user.id,  # Current user is the reporter
-        assignee_id=issue_data.assignee_id,
-        status=IssueStatus.OPEN  # Default status
-    )
-    
-    db.add(db_issue)
+    # Create issue. INSERT ... RETURNING brings back the server-generated
+    # id/created_at/updated_at in the same round-trip, instead of the extra
+    # SELECT that db.refresh() would issue
+    db_issue = db.execute(
+        insert(Issue).values(
+            project_id=project_id,
+            title=issue_data.title,
+            description=issue_data.description,
+            priority=issue_data.priority,
+            reporter_id=current_user.id,  # Current user is the reporter
+            assignee_id=issue_data.assignee_id,
+            status=IssueStatus.OPEN  # Default status
+        ).returning(Issue)
+    ).scalar_one()
     db.commit()
-    db.refresh(db_issue)
-    
+
+    # Attach the embedded users without re-querying: the reporter is the
+    # caller, and the assignee (if any) is a single PK lookup
+    set_committed_value(db_issue, "reporter", current_user)
+    set_committed_value(
+        db_issue,
+        "assignee",
+        db.get(User, db_issue.assignee_id) if db_issue.assignee_id else None
+    )
+
     return db_issue
 
 
-@router.get("/issues/{issue_id}", response_model=IssueResponse)
+# response_model=None: like the list endpoint, the detail read serves a
+# row straight from our own database, so it's built with from_orm_fast
+# and dumped through orjson instead of re-validating every field.
+@router.get("/issues/{issue_id}", response_model=None)
 def get_issue(
     issue_id: int,
     current_user: User = Depends(get_current_user),
@@ -259,28 +342,16 @@ def get_issue(
             ...
         }
     """
-    # Get issue
-    issue = db.query(Issue).filter(Issue.id == issue_id).first()
-    
-    if not issue:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Issue not found"
-        )
-    
-    # Check if user is a member of the issue's project
-    is_member = db.query(ProjectMember).filter(
-        ProjectMember.project_id == issue.project_id,
-        ProjectMember.user_id == current_user.id
-    ).first()
-    
-    if not is_member:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="You do not have access to this issue"
-        )
-    
-    return issue
+    # Fetch issue + membership check in one JOIN, with everything the
+    # detail response serializes eager-loaded
+    issue, _ = get_issue_and_membership(
+        db, issue_id, current_user.id,
+        *issue_detail_load_options()
+    )
+
+    # Plain model_dump (no exclude_none): the detail payload has always
+    # carried explicit null description/assignee keys
+    return ORJSONResponse(IssueResponse.from_orm_fast(issue).model_dump())
 
 
 @router.patch("/issues/{issue_id}", response_model=IssueResponse)
@@ -326,54 +397,44 @@ def update_issue(
             ...
         }
     """
-    # Get issue
-    issue = db.query(Issue).filter(Issue.id == issue_id).first()
-    
-    if not issue:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Issue not found"
-        )
-    
-    # Check project membership
-    member = db.query(ProjectMember).filter(
-        ProjectMember.project_id == issue.project_id,
-        ProjectMember.user_id == current_user.id
-    ).first()
+    # Fetch issue + membership check in one JOIN; the response echoes a
+    # full IssueResponse, so load its whole shape up front instead of
+    # letting reporter/assignee lazy-load during serialization
+    issue, role = get_issue_and_membership(
+        db, issue_id, current_user.id,
+        *issue_detail_load_options()
+    )
+
+    # Determine what user can update based on role
+    is_reporter = issue.reporter_id == current_user.id
+    is_maintainer = role == ProjectRole.MAINTAINER
     
-    if not member:
+    # Only fields that were provided
+    update_data = issue_update.dict(exclude_unset=True)
+
+    # Empty PATCH - nothing to write, skip the commit round-trip
+    if not update_data:
+        return issue
+
+    # Precompute the set of fields this caller may touch, then validate the
+    # whole request at once - the error no longer depends on which
+    # disallowed field happens to come first in the payload
+    allowed = set()
+    if is_reporter or is_maintainer:
+        allowed |= {"title", "description"}
+    if is_maintainer:
+        allowed |= {"status", "priority", "assignee_id"}
+
+    disallowed = update_data.keys() - allowed
+    if disallowed:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
-            detail="You do not have access to this issue"
+            detail=f"You are not allowed to update: {', '.join(sorted(disallowed))}"
         )
-    
-    # Determine what user can update based on role
-    is_reporter = issue.reporter_id == current_user.id
-    is_maintainer = member.role == ProjectRole.MAINTAINER
-    
-    # Update fields based on permissions
-    update_data = issue_update.dict(exclude_unset=True)  # Only fields that were provided
-    
+
     for field, value in update_data.items():
-        # Reporter can only update title and description
-        if field in ["title", "description"]:
-            if is_reporter or is_maintainer:
-                setattr(issue, field, value)
-            else:
-                raise HTTPException(
-                    status_code=status.HTTP_403_FORBIDDEN,
-                    detail="Only the reporter or maintainers can update this field"
-                )
-        # Only maintainers can update status, priority, assignee
-        elif field in ["status", "priority", "assignee_id"]:
-            if is_maintainer:
-                setattr(issue, field, value)
-            else:
-                raise HTTPException(
-                    status_code=status.HTTP_403_FORBIDDEN,
-                    detail="Only maintainers can update status, priority, or assignee"
-                )
-    
+        setattr(issue, field, value)
+
     db.commit()
     db.refresh(issue)
     
@@ -409,22 +470,11 @@ def delete_issue(
         
         Response 204: (no content)
     """
-    # Get issue
-    issue = db.query(Issue).filter(Issue.id == issue_id).first()
-    
-    if not issue:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Issue not found"
-        )
-    
+    # Fetch issue + membership check in one JOIN
+    issue, role = get_issue_and_membership(db, issue_id, current_user.id)
+
     # Check if user is a maintainer
-    member = db.query(ProjectMember).filter(
-        ProjectMember.project_id == issue.project_id,
-        ProjectMember.user_id == current_user.id
-    ).first()
-    
-    if not member or member.role != ProjectRole.MAINTAINER:
+    if role != ProjectRole.MAINTAINER:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Only project maintainers can delete issues"
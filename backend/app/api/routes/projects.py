@@ -9,6 +9,9 @@ Endpoints:
 """
 
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import and_, select
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 from typing import List
 from app.database import get_db
@@ -21,7 +24,8 @@ from app.schemas.project import (
     ProjectMemberAdd,
     ProjectMemberResponse
 )
-from app.core.deps import get_current_user, require_maintainer
+from app.core.deps import get_current_user, require_maintainer, invalidate_membership_cache
+from app.core.loaders import project_detail_load_options
 
 router = APIRouter()
 
@@ -69,24 +73,26 @@ def create_project(
             "created_at": "2024-01-15T10:30:00Z"
         }
     """
-    # Check if project key already exists (must be unique)
-    existing_project = db.query(Project).filter(Project.key == project_data.key).first()
-    if existing_project:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Project key '{project_data.key}' already exists"
-        )
-    
-    # Create project
+    # Create project. flush() assigns the autoincrement id without
+    # committing, so the project and its maintainer row go out in one
+    # transaction - a single fsync instead of two, and no refresh SELECT.
+    # Key uniqueness rides on the unique index instead of a pre-SELECT:
+    # one less round-trip, and no race window between check and insert.
     db_project = Project(
         name=project_data.name,
         key=project_data.key,
         description=project_data.description
     )
     db.add(db_project)
-    db.commit()
-    db.refresh(db_project)
-    
+    try:
+        db.flush()
+    except IntegrityError:
+        db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Project key '{project_data.key}' already exists"
+        )
+
     # Add creator as maintainer
     project_member = ProjectMember(
         project_id=db_project.id,
@@ -95,11 +101,15 @@ def create_project(
     )
     db.add(project_member)
     db.commit()
-    
+
     return db_project
 
 
-@router.get("", response_model=List[ProjectResponse])
+# response_model=None: the rows come straight off the projects table, so
+# re-validating every field through Pydantic is pure CPU. The handler
+# returns an ORJSONResponse built from Core rows directly; orjson
+# handles datetime natively.
+@router.get("", response_model=None)
 def list_projects(
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
@@ -136,12 +146,28 @@ def list_projects(
             }
         ]
     """
-    # Get all projects where user is a member
-    projects = db.query(Project).join(ProjectMember).filter(
+    # Get all projects where user is a member. EXISTS instead of a join:
+    # it can't duplicate Project rows if memberships ever stop being
+    # unique, and the subquery is served straight from the
+    # (user_id, project_id) index.
+    membership = db.query(ProjectMember).filter(
+        ProjectMember.project_id == Project.id,
         ProjectMember.user_id == current_user.id
-    ).all()
-    
-    return projects
+    ).exists()
+
+    # Core column select: no Project instances, no identity-map entries -
+    # the five response fields go straight from driver rows into orjson
+    rows = db.execute(
+        select(
+            Project.id,
+            Project.name,
+            Project.key,
+            Project.description,
+            Project.created_at,
+        ).where(membership)
+    ).mappings().all()
+
+    return ORJSONResponse([dict(row) for row in rows])
 
 
 @router.get("/{project_id}", response_model=ProjectDetailResponse)
@@ -200,27 +226,37 @@ def get_project(
             ]
         }
     """
-    # Get project
-    project = db.query(Project).filter(Project.id == project_id).first()
-    
-    if not project:
+    # One round-trip decides existence AND membership: outer-join the
+    # caller's own membership row onto the project, so a NULL user_id
+    # means "project exists, caller isn't a member". The response also
+    # serializes every member with their user, so eager-load that chain
+    # up front (selectinload for the collection, joinedload for the
+    # many-to-one user) instead of letting Pydantic trigger one lazy
+    # SELECT per member.
+    row = db.query(Project, ProjectMember.user_id).outerjoin(
+        ProjectMember,
+        and_(
+            ProjectMember.project_id == Project.id,
+            ProjectMember.user_id == current_user.id
+        )
+    ).options(
+        *project_detail_load_options()
+    ).filter(Project.id == project_id).first()
+
+    if row is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Project not found"
         )
-    
-    # Check if user is a member
-    is_member = db.query(ProjectMember).filter(
-        ProjectMember.project_id == project_id,
-        ProjectMember.user_id == current_user.id
-    ).first()
-    
-    if not is_member:
+
+    project, member_user_id = row
+
+    if member_user_id is None:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="You are not a member of this project"
         )
-    
+
     return project
 
 
@@ -228,7 +264,7 @@ def get_project(
 def add_project_member(
     project_id: int,
     member_data: ProjectMemberAdd,
-    current_user: User = Depends(get_current_user),
+    requester_role: ProjectRole = Depends(require_maintainer),
     db: Session = Depends(get_db)
 ):
     """
@@ -237,15 +273,14 @@ def add_project_member(
     Permissions: Only project MAINTAINERS can add members
     
     Process:
-        1. Verify requester is a maintainer
+        1. Verify requester is a maintainer (require_maintainer dependency)
         2. Find user by email
-        3. Check if already a member
-        4. Add to project with specified role
-        
+        3. Add to project with specified role (duplicates rejected by the PK)
+
     Args:
         project_id: Project ID
         member_data: ProjectMemberAdd schema with email and role
-        current_user: Authenticated user
+        requester_role: Guaranteed MAINTAINER by the dependency
         db: Database session
         
     Returns:
@@ -256,24 +291,6 @@ def add_project_member(
         404 Not Found: If user with email not found
         400 Bad Request: If user is already a member
     """
-    # First, check if current user is a maintainer
-    requester_member = db.query(ProjectMember).filter(
-        ProjectMember.project_id == project_id,
-        ProjectMember.user_id == current_user.id
-    ).first()
-    
-    if not requester_member:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="You are not a member of this project"
-        )
-    
-    if requester_member.role != ProjectRole.MAINTAINER:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Only project maintainers can add members"
-        )
-    
     # Find user by email
     user = db.query(User).filter(User.email == member_data.email).first()
     
@@ -283,26 +300,26 @@ def add_project_member(
             detail=f"User with email '{member_data.email}' not found"
         )
     
-    # Check if user is already a member
-    existing_member = db.query(ProjectMember).filter(
-        ProjectMember.project_id == project_id,
-        ProjectMember.user_id == user.id
-    ).first()
-    
-    if existing_member:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="User is already a member of this project"
-        )
-    
-    # Add user to project
+    # Add user to project. Duplicate membership is caught by the
+    # composite primary key rather than a pre-SELECT - atomic, and one
+    # less round-trip on the success path.
     new_member = ProjectMember(
         project_id=project_id,
         user_id=user.id,
         role=member_data.role
     )
     db.add(new_member)
-    db.commit()
+    try:
+        db.commit()
+    except IntegrityError:
+        db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="User is already a member of this project"
+        )
     db.refresh(new_member)
-    
+
+    # Make the new membership visible immediately, not after the cache TTL
+    invalidate_membership_cache(user.id, project_id)
+
     return new_member
\ No newline at end of file
@@ -7,18 +7,155 @@ These functions are used as dependencies in route handlers to:
 - Check if user has required permissions
 """
 
+import hashlib
+import threading
+import time
 from typing import Optional
+from cachetools import TTLCache
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from sqlalchemy.orm import Session
+from sqlalchemy import and_
+from sqlalchemy.orm import Session, undefer
 from app.database import get_db
 from app.models.user import User
+from app.models.issue import Issue
 from app.models.project import ProjectMember, ProjectRole
-from app.core.security import decode_access_token
+from app.core.security import decode_token_payload
 
 # HTTP Bearer token scheme for Swagger docs
-# This makes the "Authorize" button appear in FastAPI docs
-security = HTTPBearer()
+# This makes the "Authorize" button appear in FastAPI docs.
+# Single module-level instance; FastAPI deduplicates it within a request
+# via dependency caching. auto_error spelled out: a missing header is
+# rejected here, never in a handler.
+security = HTTPBearer(auto_error=True)
+
+# Short-lived caches so hot endpoints don't re-verify the JWT signature and
+# re-fetch the User row on every single request.
+#
+# _token_cache maps blake2b(token) -> (email, user_id, exp). We key by a
+# digest rather than the plaintext token so a leaked cache dump doesn't
+# contain usable credentials. Entries are capped at 30s but are also
+# dropped early if the token's own "exp" claim passes first, so a token
+# is never honored beyond its lifetime.
+#
+# _user_cache maps user_id -> User so repeated requests skip the
+# db.query(User) round-trip. 60s staleness is acceptable for name/email.
+#
+# _email_cache maps blake2b(email) -> User for the login path, where the
+# caller is identified by email rather than id.
+_token_cache: TTLCache = TTLCache(maxsize=10000, ttl=30)
+_user_cache: TTLCache = TTLCache(maxsize=10000, ttl=60)
+_email_cache: TTLCache = TTLCache(maxsize=50000, ttl=60)
+
+# _role_cache maps (user_id, project_id) -> ProjectRole. Membership
+# changes rarely but is checked on nearly every request, so this removes
+# a project_members SELECT from each of them. Only positive results are
+# cached - a non-member keeps hitting the database, so a freshly added
+# member is never locked out by a stale miss. Routes that change
+# membership must call invalidate_membership_cache().
+_role_cache: TTLCache = TTLCache(maxsize=100000, ttl=30)
+
+# TTLCache is not thread-safe (every access rewires an internal linked
+# list), and sync handlers run on a threadpool of up to 100 threads - all
+# cache reads and writes below go through this lock. The critical
+# sections are dict-sized; database queries stay outside it.
+_cache_lock = threading.Lock()
+
+
+def _token_cache_key(token: str) -> bytes:
+    """Digest a bearer token for use as a cache key (never cache plaintext)."""
+    return hashlib.blake2b(token.encode("utf-8"), digest_size=16).digest()
+
+
+def _email_cache_key(email: str) -> bytes:
+    """Digest an email for use as a cache key (never cache plaintext)."""
+    return hashlib.blake2b(email.encode("utf-8"), digest_size=16).digest()
+
+
+def clear_auth_caches() -> None:
+    """Drop all cached token/user entries (used by tests between databases)."""
+    with _cache_lock:
+        _token_cache.clear()
+        _user_cache.clear()
+        _email_cache.clear()
+        _role_cache.clear()
+
+
+def invalidate_email_cache(email: str) -> None:
+    """
+    Drop a cached email lookup.
+
+    Must be called when the stored row changes (e.g. the login rehash
+    upgrade), so later logins read the new state instead of a stale
+    cached instance.
+    """
+    with _cache_lock:
+        _email_cache.pop(_email_cache_key(email), None)
+
+
+def invalidate_membership_cache(user_id: int, project_id: int) -> None:
+    """
+    Drop a cached project role after a membership change.
+
+    Must be called by any route that adds, removes, or re-roles a member,
+    so the change is visible immediately rather than after the cache TTL.
+    """
+    with _cache_lock:
+        _role_cache.pop((user_id, project_id), None)
+
+
+def _lookup_project_role(
+    db: Session, user_id: int, project_id: int
+) -> Optional[ProjectRole]:
+    """Fetch a user's role in a project through the role cache."""
+    key = (user_id, project_id)
+
+    with _cache_lock:
+        role = _role_cache.get(key)
+    if role is None:
+        value = db.query(ProjectMember.role).filter(
+            ProjectMember.project_id == project_id,
+            ProjectMember.user_id == user_id
+        ).scalar()
+        if value is not None:
+            # Stored as a plain string - hand callers the enum member
+            role = ProjectRole(value)
+            with _cache_lock:
+                _role_cache[key] = role
+
+    return role
+
+
+def lookup_user_by_email(db: Session, email: str) -> Optional[User]:
+    """
+    Fetch a user by email through a short TTL cache.
+
+    Repeat logins from the same account within the cache window skip the
+    unique-index SELECT entirely. Keys are email digests, not plaintext
+    addresses.
+
+    Args:
+        db: Database session
+        email: Email address to look up
+
+    Returns:
+        User object, or None if no such user exists
+    """
+    key = _email_cache_key(email)
+
+    with _cache_lock:
+        user = _email_cache.get(key)
+    if user is None:
+        # undefer: login is the one consumer of password_hash, so load it
+        # here in the same SELECT instead of a second round-trip later
+        user = db.query(User).options(
+            undefer(User.password_hash)
+        ).filter(User.email == email).first()
+        if user is not None:
+            with _cache_lock:
+                _email_cache[key] = user
+
+    return user
 
 
 def get_current_user(
@@ -51,27 +188,57 @@ def get_current_user(
     """
     # Extract token from "Bearer <token>"
     token = credentials.credentials
-    
-    # Decode token to get user email
-    email = decode_access_token(token)
-    
-    if email is None:
+    cache_key = _token_cache_key(token)
+
+    # Fast path: token verified recently - skip jwt.decode entirely
+    with _cache_lock:
+        cached = _token_cache.get(cache_key)
+        if cached is not None:
+            email, user_id, exp = cached
+            if exp is not None and time.time() >= exp:
+                # Token expired since we cached it - treat as a miss
+                _token_cache.pop(cache_key, None)
+                cached = None
+    if cached is not None:
+        with _cache_lock:
+            user = _user_cache.get(user_id)
+        if user is not None:
+            return user
+        # User entry aged out - re-fetch just the row, token stays trusted
+        user = db.query(User).filter(User.email == email).first()
+        if user is not None:
+            with _cache_lock:
+                _user_cache[user_id] = user
+            return user
+        # User was deleted - fall through to the full validation path
+
+    # Slow path: decode and verify token signature
+    payload = decode_token_payload(token)
+
+    if payload is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Could not validate credentials",
             headers={"WWW-Authenticate": "Bearer"},
         )
-    
+
+    email = payload["sub"]
+
     # Look up user in database
     user = db.query(User).filter(User.email == email).first()
-    
+
     if user is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="User not found",
             headers={"WWW-Authenticate": "Bearer"},
         )
-    
+
+    # Populate caches for subsequent requests with this token
+    with _cache_lock:
+        _token_cache[cache_key] = (email, user.id, payload.get("exp"))
+        _user_cache[user.id] = user
+
     return user
 
 
@@ -79,89 +246,151 @@ def get_project_member(
     project_id: int,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
-) -> ProjectMember:
+) -> ProjectRole:
     """
     Verify that current user is a member of the specified project.
-    
+
+    Selects only the role column - the routes just need the membership
+    fact and the role, so there is no reason to hydrate a full
+    ProjectMember object into the identity map. Positive results come
+    from the short-TTL role cache, so repeat requests skip the SELECT.
+
     Args:
         project_id: ID of the project to check
         current_user: Currently authenticated user
         db: Database session
-        
+
     Returns:
-        ProjectMember object (contains user's role in project)
-        
+        The user's ProjectRole in the project
+
     Raises:
         HTTPException 403: If user is not a member of the project
-        
+
     Example usage:
         @app.get("/api/projects/{project_id}/issues")
         def get_issues(
             project_id: int,
-            member: ProjectMember = Depends(get_project_member)
+            member: ProjectRole = Depends(get_project_member)
         ):
             # User is guaranteed to be a project member here
-            # Can check member.role for permissions
+            # Can check the role for permissions
             ...
     """
-    member = db.query(ProjectMember).filter(
-        ProjectMember.project_id == project_id,
-        ProjectMember.user_id == current_user.id
-    ).first()
-    
-    if not member:
+    role = _lookup_project_role(db, current_user.id, project_id)
+
+    if role is None:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="You are not a member of this project"
         )
-    
-    return member
+
+    return role
 
 
 def require_maintainer(
     project_id: int,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
-) -> ProjectMember:
+) -> ProjectRole:
     """
     Verify that current user is a MAINTAINER of the specified project.
-    
+
     Args:
         project_id: ID of the project to check
         current_user: Currently authenticated user
         db: Database session
-        
+
     Returns:
-        ProjectMember object with MAINTAINER role
-        
+        ProjectRole.MAINTAINER
+
     Raises:
         HTTPException 403: If user is not a maintainer
-        
+
     Example usage:
         @app.patch("/api/issues/{issue_id}")
         def update_issue(
             issue_id: int,
-            maintainer: ProjectMember = Depends(require_maintainer)
+            maintainer: ProjectRole = Depends(require_maintainer)
         ):
             # User is guaranteed to be a maintainer here
             # Can perform privileged operations
             ...
     """
-    member = db.query(ProjectMember).filter(
-        ProjectMember.project_id == project_id,
-        ProjectMember.user_id == current_user.id
-    ).first()
-    
-    if not member:
+    role = _lookup_project_role(db, current_user.id, project_id)
+
+    if role is None:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="You are not a member of this project"
         )
-    
-    if member.role != ProjectRole.MAINTAINER:
+
+    # Identity compare: enum members are singletons, and "is not" skips
+    # the str-mixin __eq__ fallback that value comparison can take
+    if role is not ProjectRole.MAINTAINER:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Only project maintainers can perform this action"
         )
-    
-    return member
\ No newline at end of file
+
+    return role
+
+
+def get_issue_and_membership(
+    db: Session,
+    issue_id: int,
+    user_id: int,
+    *options
+):
+    """
+    Fetch an issue and the caller's project membership in a single JOIN.
+
+    The issue endpoints all need the same two facts - "does the issue
+    exist?" and "is the caller a member of its project?" - and fetching
+    them separately costs two sequential round-trips per request. This
+    joins issues to project_members on (project_id, user_id) so both
+    come back in one query. Only the member's role column is selected -
+    no caller needs more, so the full ProjectMember row is never
+    hydrated.
+
+    Args:
+        db: Database session
+        issue_id: Issue ID to fetch
+        user_id: ID of the user whose membership to check
+        *options: Optional loader options applied to the Issue entity
+            (e.g. joinedload(Issue.reporter))
+
+    Returns:
+        (Issue, ProjectRole) tuple
+
+    Raises:
+        HTTPException 404: If the issue doesn't exist
+        HTTPException 403: If the user is not a member of the issue's project
+    """
+    query = db.query(Issue, ProjectMember.role).join(
+        ProjectMember,
+        and_(
+            ProjectMember.project_id == Issue.project_id,
+            ProjectMember.user_id == user_id
+        )
+    ).filter(Issue.id == issue_id)
+
+    if options:
+        query = query.options(*options)
+
+    row = query.first()
+
+    if row is not None:
+        return row[0], ProjectRole(row[1])
+
+    # Join came back empty - one cheap scalar query tells us whether the
+    # issue is missing (404) or the caller just isn't a member (403)
+    if db.query(Issue.id).filter(Issue.id == issue_id).scalar() is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Issue not found"
+        )
+
+    raise HTTPException(
+        status_code=status.HTTP_403_FORBIDDEN,
+        detail="You do not have access to this issue"
+    )
@@ -0,0 +1,94 @@
+"""
+Batch loaders for attaching related users to list responses.
+
+Even with joined eager loading, every issue row in a list page drags its
+own copy of the reporter/assignee columns through the join, although a
+page is typically reported and assigned among a handful of people. A
+DataLoader-style batch fetch loads each distinct user exactly once via a
+single IN (...) query and attaches the results to the parent objects.
+"""
+
+from typing import Dict, Iterable, List, Optional
+
+from sqlalchemy.orm import Session, joinedload, selectinload, undefer
+from sqlalchemy.orm.attributes import set_committed_value
+
+from app.models.comment import Comment
+from app.models.issue import Issue
+from app.models.project import Project, ProjectMember
+from app.models.user import User
+
+
+def issue_detail_load_options():
+    """
+    Loader options for endpoints that serialize a full IssueResponse.
+
+    One place to keep the option set matching the response shape: the
+    full (deferred) description plus reporter/assignee joined in the
+    same round-trip, so serialization never falls back to lazy loads.
+    """
+    return (
+        undefer(Issue.description),
+        joinedload(Issue.reporter),
+        joinedload(Issue.assignee),
+    )
+
+
+def project_detail_load_options():
+    """
+    Loader options matching ProjectDetailResponse: the member collection
+    batched in one IN query, each member's user joined onto it.
+    """
+    return (
+        selectinload(Project.members).joinedload(ProjectMember.user),
+    )
+
+
+class UserLoader:
+    """
+    Collects user ids, fetches each distinct user once, and attaches the
+    loaded User objects to parent rows without triggering lazy loads.
+
+    Usage:
+        issues = query.all()
+        UserLoader(db).attach_issue_users(issues)
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+        self._users_by_id: Dict[int, User] = {}
+
+    def load(self, user_ids: Iterable[Optional[int]]) -> Dict[int, User]:
+        """
+        Fetch all not-yet-loaded users among user_ids in one IN (...) query.
+
+        None entries (e.g. unassigned issues) are skipped. Returns the
+        accumulated id -> User mapping.
+        """
+        missing = {
+            user_id for user_id in user_ids
+            if user_id is not None and user_id not in self._users_by_id
+        }
+        if missing:
+            for user in self.db.query(User).filter(User.id.in_(missing)).all():
+                self._users_by_id[user.id] = user
+        return self._users_by_id
+
+    def attach_issue_users(self, issues: List[Issue]) -> None:
+        """Populate issue.reporter and issue.assignee for a page of issues."""
+        users = self.load(
+            [issue.reporter_id for issue in issues]
+            + [issue.assignee_id for issue in issues]
+        )
+        for issue in issues:
+            # set_committed_value populates the relationship as if it had
+            # been loaded, without dirtying the session or firing a lazy
+            # load (which raiseload would reject anyway)
+            set_committed_value(issue, "reporter", users.get(issue.reporter_id))
+            set_committed_value(issue, "assignee", users.get(issue.assignee_id))
+
+    def attach_comment_authors(self, comments: List[Comment]) -> None:
+        """Populate comment.author for a list of comments."""
+        users = self.load([comment.author_id for comment in comments])
+        for comment in comments:
+            set_committed_value(comment, "author", users.get(comment.author_id))
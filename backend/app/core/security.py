@@ -2,21 +2,40 @@
 Security utilities for authentication and authorization.
 
 Handles:
-- Password hashing (bcrypt) - never store plain passwords!
+- Password hashing (Argon2id) - never store plain passwords!
 - Password verification
 - JWT token creation and validation
 - Token payload structure
 """
 
-from datetime import datetime, timedelta
+import time
+from datetime import timedelta
 from typing import Optional
-from jose import JWTError, jwt
+import jwt
+from jwt import InvalidTokenError
 from passlib.context import CryptContext
 from app.config import settings
 
-# Password hashing context using bcrypt
-# bcrypt is slow by design - makes brute force attacks impractical
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Password hashing context using Argon2id (memory-hard, GPU-resistant)
+# Argon2id costs attackers RAM as well as CPU, so it resists GPU cracking
+# far better than bcrypt at a comparable per-hash cost on our side.
+# Old bcrypt hashes still verify ("deprecated" scheme) and are transparently
+# upgraded on login via pwd_context.needs_update().
+pwd_context = CryptContext(
+    schemes=["argon2", "bcrypt"],
+    deprecated="auto",
+    argon2__memory_cost=65536,  # 64 MiB per hash
+    argon2__time_cost=3,
+    argon2__parallelism=1,
+)
+
+# Resolved once at import so the per-request hot path doesn't rebuild
+# them: jwt.decode receives the same algorithm list object on every call,
+# and token creation adds a precomputed integer instead of constructing a
+# timedelta per login. (The argon2 backend itself is warmed at import by
+# the dummy-hash computation in app.api.routes.auth.)
+_ALGORITHMS = [settings.ALGORITHM]
+_ACCESS_TOKEN_TTL_SECONDS = settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
@@ -25,13 +44,13 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     
     Args:
         plain_password: The password user entered (e.g., "mypassword123")
-        hashed_password: The bcrypt hash from database (e.g., "$2b$12$...")
+        hashed_password: The hash from database (e.g., "$argon2id$v=19$...")
         
     Returns:
         True if password matches, False otherwise
         
     Example:
-        >>> stored_hash = "$2b$12$abcd..."  # From database
+        >>> stored_hash = "$argon2id$v=19$..."  # From database
         >>> verify_password("correct", stored_hash)  # Returns True
         >>> verify_password("wrong", stored_hash)    # Returns False
     """
@@ -40,25 +59,42 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
 
 def get_password_hash(password: str) -> str:
     """
-    Hash a plain password using bcrypt.
-    
+    Hash a plain password using Argon2id.
+
     Args:
         password: Plain text password to hash
-        
+
     Returns:
-        Bcrypt hashed password string
-        
+        Argon2id hashed password string
+
     Example:
         >>> get_password_hash("mypassword123")
-        "$2b$12$KIXxKj9V.../hashed_string..."
-        
+        "$argon2id$v=19$m=65536,t=3,p=1$.../hashed_string..."
+
     Note:
-        - Same password will generate different hashes each time (bcrypt uses salt)
+        - Same password will generate different hashes each time (random salt)
         - This is intentional and secure
     """
     return pwd_context.hash(password)
 
 
+def password_needs_rehash(hashed_password: str) -> bool:
+    """
+    Check whether a stored hash uses an outdated scheme or parameters.
+
+    Used after a successful login to opportunistically upgrade legacy
+    bcrypt hashes (or old Argon2 parameters) to the current Argon2id
+    configuration - the only moment we hold the plain password.
+
+    Args:
+        hashed_password: The hash currently stored in the database
+
+    Returns:
+        True if the hash should be regenerated with get_password_hash()
+    """
+    return pwd_context.needs_update(hashed_password)
+
+
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
     """
     Create a JWT access token for authentication.
@@ -85,16 +121,17 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
         - Cannot be modified without secret
         - Expires after ACCESS_TOKEN_EXPIRE_MINUTES (default: 30 minutes)
     """
-    to_encode = data.copy()
-    
-    # Set expiration time
+    # Set expiration time. time.time() plus integer seconds is cheaper
+    # than the utcnow() + timedelta dance and produces the same epoch
+    # claim jwt.encode would derive from a datetime anyway.
     if expires_delta:
-        expire = datetime.utcnow() + expires_delta
+        expire = int(time.time() + expires_delta.total_seconds())
     else:
-        expire = datetime.utcnow() + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
-    
-    to_encode.update({"exp": expire})
-    
+        expire = int(time.time()) + _ACCESS_TOKEN_TTL_SECONDS
+
+    # Build the claims dict in one expression instead of copy + update
+    to_encode = {**data, "exp": expire}
+
     # Encode and sign the token
     encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
     return encoded_jwt
@@ -121,16 +158,37 @@ def decode_access_token(token: str) -> Optional[str]:
         - Token is malformed
         - Subject (email) is missing
     """
+    payload = decode_token_payload(token)
+
+    if payload is None:
+        return None
+
+    return payload.get("sub")
+
+
+def decode_token_payload(token: str) -> Optional[dict]:
+    """
+    Decode and verify a JWT token, returning the full payload.
+
+    Unlike decode_access_token, this exposes all claims (e.g. "exp"),
+    which callers like the auth cache in app.core.deps need in order to
+    respect token expiry.
+
+    Args:
+        token: JWT token string
+
+    Returns:
+        Decoded payload dict if token is valid, None otherwise
+    """
     try:
         # Decode and verify token signature
-        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
-        email: str = payload.get("sub")
-        
-        if email is None:
+        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=_ALGORITHMS)
+
+        if payload.get("sub") is None:
             return None
-            
-        return email
-        
-    except JWTError:
+
+        return payload
+
+    except InvalidTokenError:
         # Token is invalid, expired, or malformed
         return None
\ No newline at end of file
@@ -10,6 +10,7 @@ This file:
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from app.api.routes import auth, projects, issues, comments
 
 # Create FastAPI application instance
@@ -18,26 +19,55 @@ app = FastAPI(
     description="A lightweight bug tracker for teams to manage projects and issues",
     version="1.0.0",
     docs_url="/api/docs",  # Swagger UI at /api/docs
-    redoc_url="/api/redoc"  # ReDoc at /api/redoc
+    redoc_url="/api/redoc",  # ReDoc at /api/redoc
+    # orjson serializes responses (incl. datetimes) in native code - list
+    # endpoints spend most of their CPU in JSON encoding otherwise
+    default_response_class=ORJSONResponse
 )
 
-# Configure CORS - allows frontend (React) to communicate with backend
-# In production, replace "*" with your actual frontend domain
+# Configure CORS - allows frontend (React) to communicate with backend.
+# Concrete method/header lists (no "*") let Starlette precompute the
+# preflight response headers once at startup and reuse them, instead of
+# echoing the request's headers back per preflight. The API only speaks
+# these methods and the frontend only sends these headers.
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=[
+    allow_origins=(
         "http://localhost:5173",  # Vite default dev server
         "http://localhost:3000",  # Alternative React port
         "http://127.0.0.1:5173",
         "http://127.0.0.1:3000",
         # Add your production frontend URL here when deploying
-    ],
+    ),
     allow_credentials=True,  # Allow cookies/auth headers
-    allow_methods=["*"],  # Allow all HTTP methods (GET, POST, PUT, DELETE, etc.)
-    allow_headers=["*"],  # Allow all headers
+    allow_methods=("GET", "POST", "PATCH", "DELETE", "OPTIONS"),
+    allow_headers=("Authorization", "Content-Type"),
 )
 
 
+# Sync route handlers (all of ours - the DB stack is sync SQLAlchemy on
+# psycopg2) run in anyio's worker threadpool, which defaults to 40 threads.
+# Under bursts of I/O-bound requests like list_issues that cap becomes the
+# throughput ceiling, so raise it: the handlers spend their time waiting on
+# the database, not holding a CPU.
+@app.on_event("startup")
+def expand_sync_threadpool():
+    import anyio
+    anyio.to_thread.current_default_thread_limiter().total_tokens = 100
+
+
+# Pre-create the database connection pool before traffic arrives, so the
+# first burst of requests doesn't pay TCP+TLS+auth handshakes inline.
+# Opening POOL_SIZE connections at once forces the pool to actually
+# allocate them; they are all returned to the pool afterwards.
+@app.on_event("startup")
+def warm_db_pool():
+    from app.database import engine, POOL_SIZE
+    connections = [engine.connect() for _ in range(POOL_SIZE)]
+    for connection in connections:
+        connection.close()
+
+
 # Root endpoint - simple welcome message
 @app.get("/")
 def read_root():
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, Text, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, Text, DateTime, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.database import Base
@@ -26,6 +26,12 @@ class Comment(Base):
     """
     __tablename__ = "comments"
 
+    # Matches the list_comments query: filter by issue_id, order by
+    # created_at asc. Kept in sync with the Alembic migrations.
+    __table_args__ = (
+        Index('ix_comments_issue_created', 'issue_id', 'created_at'),
+    )
+
     id = Column(Integer, primary_key=True, index=True)
     issue_id = Column(Integer, ForeignKey("issues.id", ondelete="CASCADE"), nullable=False, index=True)
     author_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
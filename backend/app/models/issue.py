@@ -1,5 +1,5 @@
-from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Enum
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, CheckConstraint, Index, text
+from sqlalchemy.orm import relationship, deferred
 from sqlalchemy.sql import func
 import enum
 from app.database import Base
@@ -53,12 +53,42 @@ class Issue(Base):
     """
     __tablename__ = "issues"
 
+    # Composite indexes matching the list_issues filter+sort shapes
+    # (project_id plus an optional narrowing column, ordered by
+    # created_at desc). The assignee index is partial since most issues
+    # are unassigned. Kept in sync with the Alembic migrations.
+    __table_args__ = (
+        Index('ix_issues_project_status_created',
+              'project_id', 'status', text('created_at DESC')),
+        Index('ix_issues_project_priority_created',
+              'project_id', 'priority', text('created_at DESC')),
+        Index('ix_issues_project_assignee_created',
+              'project_id', 'assignee_id', text('created_at DESC'),
+              postgresql_where=text('assignee_id IS NOT NULL'),
+              sqlite_where=text('assignee_id IS NOT NULL')),
+        CheckConstraint(
+            "status IN ('open', 'in_progress', 'resolved', 'closed')",
+            name='ck_issues_status'),
+        CheckConstraint(
+            "priority IN ('low', 'medium', 'high', 'critical')",
+            name='ck_issues_priority'),
+    )
+
     id = Column(Integer, primary_key=True, index=True)
     project_id = Column(Integer, ForeignKey("projects.id", ondelete="CASCADE"), nullable=False, index=True)
     title = Column(String, nullable=False)
-    description = Column(Text, nullable=True)
-    status = Column(Enum(IssueStatus), nullable=False, default=IssueStatus.OPEN, index=True)  # Index for filtering
-    priority = Column(Enum(IssuePriority), nullable=False, default=IssuePriority.MEDIUM, index=True)
+    # Deferred: descriptions can be kilobytes and the list view only shows
+    # a snippet, so plain queries don't haul the full text per row.
+    # Detail paths opt back in with undefer(Issue.description); the list
+    # path selects a short preview expression instead.
+    description = deferred(Column(Text, nullable=True))
+    # Plain VARCHAR + CHECK instead of native enum types: identical query
+    # performance, but adding a state is a constraint swap rather than an
+    # ALTER TYPE. Stored values are the enum values (e.g. 'in_progress').
+    # No single-column indexes here: every status/priority filter also
+    # filters on project_id, and the composite indexes above lead with it.
+    status = Column(String(16), nullable=False, default=IssueStatus.OPEN.value)
+    priority = Column(String(16), nullable=False, default=IssuePriority.MEDIUM.value)
     
     # Reporter is required (who filed the bug?)
     reporter_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
@@ -74,4 +104,10 @@ class Issue(Base):
     project = relationship("Project", back_populates="issues")
     reporter = relationship("User", back_populates="reported_issues", foreign_keys=[reporter_id])
     assignee = relationship("User", back_populates="assigned_issues", foreign_keys=[assignee_id])
-    comments = relationship("Comment", back_populates="issue", cascade="all, delete-orphan")
\ No newline at end of file
+    # lazy="raise": comments are always fetched by their own query, never
+    # by traversing issue.comments - accidental traversal should fail
+    # loudly. passive_deletes lets the ON DELETE CASCADE FK clean up on
+    # issue delete instead of loading the whole thread first.
+    comments = relationship("Comment", back_populates="issue",
+                            cascade="all, delete-orphan",
+                            lazy="raise", passive_deletes=True)
\ No newline at end of file
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Enum
+from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, CheckConstraint, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 import enum
@@ -36,9 +36,17 @@ class Project(Base):
     description = Column(Text, nullable=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
 
-    # Relationships
-    issues = relationship("Issue", back_populates="project", cascade="all, delete-orphan")
-    members = relationship("ProjectMember", back_populates="project", cascade="all, delete-orphan")
+    # Relationships. lazy="raise" turns any accidental traversal into a
+    # loud error instead of a silent N+1 - query sites that genuinely
+    # need a collection opt in with selectinload. passive_deletes defers
+    # child cleanup to the ON DELETE CASCADE foreign keys, so deleting a
+    # project doesn't first load every child row.
+    issues = relationship("Issue", back_populates="project",
+                          cascade="all, delete-orphan",
+                          lazy="raise", passive_deletes=True)
+    members = relationship("ProjectMember", back_populates="project",
+                           cascade="all, delete-orphan",
+                           lazy="raise", passive_deletes=True)
 
 
 class ProjectMember(Base):
@@ -57,10 +65,27 @@ class ProjectMember(Base):
     """
     __tablename__ = "project_members"
 
+    # The PK indexes (project_id, user_id), which serves the per-project
+    # membership checks but not list_projects' WHERE user_id = ?. This
+    # reversed composite gives that query a direct index range scan, and
+    # carrying role as a trailing column makes the authz probe
+    # ("SELECT role WHERE user_id=? AND project_id=?") an index-only
+    # scan - the hottest query in the app never touches the heap.
+    # Kept in sync with the Alembic migrations.
+    __table_args__ = (
+        Index('ix_project_members_user_project', 'user_id', 'project_id', 'role'),
+        CheckConstraint("role IN ('member', 'maintainer')",
+                        name='ck_project_members_role'),
+    )
+
     # Composite primary key (a user can only have one role per project)
     project_id = Column(Integer, ForeignKey("projects.id", ondelete="CASCADE"), primary_key=True)
     user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
-    role = Column(Enum(ProjectRole), nullable=False, default=ProjectRole.MEMBER)
+    # Plain VARCHAR + CHECK instead of a native enum type: same lookup
+    # performance, but role changes are a constraint swap rather than an
+    # ALTER TYPE, and indexes stay simple strings. Values are the
+    # ProjectRole enum values; the deps layer converts back to the enum.
+    role = Column(String(16), nullable=False, default=ProjectRole.MEMBER.value)
 
     # Relationships
     project = relationship("Project", back_populates="members")
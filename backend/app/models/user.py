@@ -1,5 +1,5 @@
 from sqlalchemy import Column, Integer, String, DateTime
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import deferred, relationship
 from sqlalchemy.sql import func
 from app.database import Base
 
@@ -11,7 +11,7 @@ class User(Base):
         id: Primary key
         name: User's display name
         email: Unique email for login (used as username)
-        password_hash: Bcrypt hashed password (never store plain passwords!)
+        password_hash: Argon2id hashed password (never store plain passwords!)
         created_at: Timestamp when user account was created
         
     Relationships:
@@ -22,11 +22,20 @@ class User(Base):
     """
     __tablename__ = "users"
 
-    # Primary fields
-    id = Column(Integer, primary_key=True, index=True)
-    name = Column(String, nullable=False)
-    email = Column(String, unique=True, index=True, nullable=False)  # Index for fast login lookups
-    password_hash = Column(String, nullable=False)  # Hashed with bcrypt
+    # Primary fields. Length caps match what the schemas already enforce
+    # (name <= 100, email <= 254 per RFC) instead of unbounded TEXT;
+    # password_hash fits Argon2id output (~97 chars) with headroom.
+    # No index=True on id or email: the primary key and the unique
+    # constraint each already build the index that serves lookups - a
+    # second index on top is pure write overhead.
+    id = Column(Integer, primary_key=True)
+    name = Column(String(100), nullable=False)
+    email = Column(String(254), unique=True, nullable=False)
+    # Deferred: the hash is only ever read by the login path, which
+    # undefers it explicitly. Everywhere else (auth lookups, nested
+    # reporter/assignee/author users) materializes User without dragging
+    # ~100 bytes of hash per row across the wire.
+    password_hash = deferred(Column(String(128), nullable=False))  # Argon2id (legacy bcrypt verified + rehashed on login)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
 
     # Relationships - SQLAlchemy will handle the joins
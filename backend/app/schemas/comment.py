@@ -52,4 +52,15 @@ class CommentResponse(BaseModel):
     created_at: datetime
 
     class Config:
-        from_attributes = True
\ No newline at end of file
+        from_attributes = True
+
+    @classmethod
+    def from_orm_fast(cls, comment) -> "CommentResponse":
+        """Build from a trusted ORM row, bypassing field validation."""
+        return cls.model_construct(
+            id=comment.id,
+            issue_id=comment.issue_id,
+            author=UserResponse.from_orm_fast(comment.author),
+            body=comment.body,
+            created_at=comment.created_at,
+        )
\ No newline at end of file
@@ -6,7 +6,7 @@ from pydantic import BaseModel, Field
 from datetime import datetime
 from typing import Optional
 from app.models.issue import IssueStatus, IssuePriority
-from app.schemas.user import UserResponse
+from app.schemas.user import UserResponse, UserSummary
 
 
 class IssueCreate(BaseModel):
@@ -92,8 +92,12 @@ class IssueResponse(BaseModel):
     project_id: int
     title: str
     description: Optional[str]
-    status: IssueStatus
-    priority: IssuePriority
+    # Plain str, not the enum types: the database only ever holds
+    # validated enum values, so coercing each row back into IssueStatus/
+    # IssuePriority on output is wasted work. The enums stay on
+    # IssueCreate/IssueUpdate where untrusted input needs checking.
+    status: str
+    priority: str
     reporter: UserResponse  # Nested user object
     assignee: Optional[UserResponse]  # Can be None if unassigned
     created_at: datetime
@@ -102,6 +106,81 @@ class IssueResponse(BaseModel):
     class Config:
         from_attributes = True
 
+    @classmethod
+    def from_orm_fast(cls, issue) -> "IssueResponse":
+        """
+        Build from a trusted ORM row, bypassing field validation.
+
+        Same contract as the other from_orm_fast builders: the row came
+        out of our own database, so the generic from_attributes walk and
+        per-field validators are skipped, including the nested users.
+        """
+        return cls.model_construct(
+            id=issue.id,
+            project_id=issue.project_id,
+            title=issue.title,
+            description=issue.description,
+            status=issue.status,
+            priority=issue.priority,
+            reporter=UserResponse.from_orm_fast(issue.reporter),
+            assignee=(
+                UserResponse.from_orm_fast(issue.assignee)
+                if issue.assignee is not None else None
+            ),
+            created_at=issue.created_at,
+            updated_at=issue.updated_at,
+        )
+
+
+class IssueListItem(BaseModel):
+    """
+    Lean issue schema for list responses.
+
+    A list page serializes dozens of these per request, so it carries
+    only what the list view renders: core issue fields, the 200-char
+    description preview, and two-field user summaries instead of full
+    nested UserResponse objects. The full IssueResponse stays on the
+    single-issue endpoints.
+    """
+    id: int
+    project_id: int
+    title: str
+    description: Optional[str]  # Preview only (first 200 chars)
+    status: str  # Stored values are already validated - see IssueResponse
+    priority: str
+    reporter: UserSummary
+    assignee: Optional[UserSummary]
+    created_at: datetime
+    updated_at: datetime
+
+    class Config:
+        from_attributes = True
+
+    @classmethod
+    def from_orm_fast(cls, issue) -> "IssueListItem":
+        """
+        Build from a trusted ORM row, bypassing field validation.
+
+        The list endpoint serializes a page of these per request;
+        model_construct skips the validator pipeline for data that just
+        came out of our own database.
+        """
+        return cls.model_construct(
+            id=issue.id,
+            project_id=issue.project_id,
+            title=issue.title,
+            description=issue.description,
+            status=issue.status,
+            priority=issue.priority,
+            reporter=UserSummary.from_orm_fast(issue.reporter),
+            assignee=(
+                UserSummary.from_orm_fast(issue.assignee)
+                if issue.assignee is not None else None
+            ),
+            created_at=issue.created_at,
+            updated_at=issue.updated_at,
+        )
+
 
 class IssueListResponse(BaseModel):
     """
@@ -112,12 +191,62 @@ class IssueListResponse(BaseModel):
     Example response:
         {
             "issues": [...],
-            "total": 42,
+            "total": null,
             "page": 1,
-            "page_size": 20
+            "page_size": 20,
+            "next_cursor": "MjAyNC0wMS0xNVQxMDozMDowMHwxNw=="
         }
+
+    Note:
+        - next_cursor is an opaque token for fetching the next page;
+          null means there are no more results
+        - total is only populated when the request sets include_total=true,
+          since COUNT(*) over the filtered set is expensive at scale
     """
-    issues: list[IssueResponse]
-    total: int
+    issues: list[IssueListItem]
+    total: Optional[int] = None
     page: int = 1
-    page_size: int = 20
\ No newline at end of file
+    page_size: int = 20
+    next_cursor: Optional[str] = None
+
+
+def serialize_issue_list(issues, total, page, page_size, next_cursor) -> dict:
+    """
+    Build the IssueListResponse payload as plain dicts, ready for orjson.
+
+    The list endpoint is the hottest serialization path in the app; even
+    model_construct + model_dump still walks Pydantic's per-field
+    machinery for every row. This helper goes straight from ORM
+    attributes to dicts - the field set is spelled out once here and
+    mirrors IssueListItem/UserSummary, which remain the documented shape
+    of the response. None-valued optionals are omitted, matching
+    model_dump(exclude_none=True).
+    """
+    items = []
+    for issue in issues:
+        item = {
+            "id": issue.id,
+            "project_id": issue.project_id,
+            "title": issue.title,
+        }
+        if issue.description is not None:
+            item["description"] = issue.description
+        item["status"] = issue.status
+        item["priority"] = issue.priority
+        reporter = issue.reporter
+        item["reporter"] = {"id": reporter.id, "name": reporter.name}
+        assignee = issue.assignee
+        if assignee is not None:
+            item["assignee"] = {"id": assignee.id, "name": assignee.name}
+        item["created_at"] = issue.created_at
+        item["updated_at"] = issue.updated_at
+        items.append(item)
+
+    payload = {"issues": items}
+    if total is not None:
+        payload["total"] = total
+    payload["page"] = page
+    payload["page_size"] = page_size
+    if next_cursor is not None:
+        payload["next_cursor"] = next_cursor
+    return payload
\ No newline at end of file
@@ -7,10 +7,19 @@ Schemas define:
 - Validation rules for each field
 """
 
-from pydantic import BaseModel, EmailStr, Field
+import re
+
+from pydantic import BaseModel, EmailStr, Field, field_validator
 from datetime import datetime
 from typing import Optional
 
+# Cheap RFC-ish shape check for the login hot path. EmailStr pulls in
+# email-validator (idna encoding, full syntax walk) on every request;
+# for login that rigor buys nothing - either the address matches a
+# stored account or it doesn't. Signup keeps the real EmailStr so only
+# properly-formed addresses ever enter the database.
+_EMAIL_RE = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+
 
 class UserCreate(BaseModel):
     """
@@ -42,9 +51,17 @@ class UserLogin(BaseModel):
             "password": "SecurePass123!"
         }
     """
-    email: EmailStr = Field(..., description="Email address")
+    email: str = Field(..., description="Email address")
     password: str = Field(..., description="Password")
 
+    @field_validator("email", mode="before")
+    @classmethod
+    def _check_email_shape(cls, value):
+        """Fast regex shape check - see _EMAIL_RE above."""
+        if isinstance(value, str) and _EMAIL_RE.match(value):
+            return value
+        raise ValueError("value is not a valid email address")
+
 
 class UserResponse(BaseModel):
     """
@@ -71,6 +88,47 @@ class UserResponse(BaseModel):
         # Allows Pydantic to work with SQLAlchemy models
         from_attributes = True
 
+    @classmethod
+    def from_orm_fast(cls, user) -> "UserResponse":
+        """
+        Build from a trusted ORM row, bypassing field validation.
+
+        Only for rows that came out of our own database - request data
+        must keep going through normal validation.
+        """
+        return cls.model_construct(
+            id=user.id,
+            name=user.name,
+            email=user.email,
+            created_at=user.created_at,
+        )
+
+
+class UserSummary(BaseModel):
+    """
+    Minimal user reference for nesting in list responses.
+
+    Carries just enough for the UI to render a name next to an issue.
+    Full UserResponse objects (with email/created_at) stay on the detail
+    endpoints, so list serialization doesn't pay for fields nobody shows.
+
+    Example:
+        {
+            "id": 2,
+            "name": "Bob Smith"
+        }
+    """
+    id: int
+    name: str
+
+    class Config:
+        from_attributes = True
+
+    @classmethod
+    def from_orm_fast(cls, user) -> "UserSummary":
+        """Build from a trusted ORM row, bypassing field validation."""
+        return cls.model_construct(id=user.id, name=user.name)
+
 
 class TokenResponse(BaseModel):
     """
@@ -10,6 +10,8 @@ Creates:
 Run with: python seed.py
 """
 
+from sqlalchemy import insert
+
 from app.database import SessionLocal
 from app.models.user import User
 from app.models.project import Project, ProjectMember, ProjectRole
@@ -19,218 +21,206 @@ from app.core.security import get_password_hash
 
 def seed_database():
     db = SessionLocal()
-    
+
     try:
         print("🌱 Seeding database...")
-        
-        # Create users
-        print("Creating users...")
-        alice = User(
-            name="Alice Johnson",
-            email="alice@example.com",
-            password_hash=get_password_hash("password123")
-        )
-        bob = User(
-            name="Bob Smith",
-            email="bob@example.com",
-            password_hash=get_password_hash("password123")
-        )
-        charlie = User(
-            name="Charlie Davis",
-            email="charlie@example.com",
-            password_hash=get_password_hash("password123")
-        )
-        
-        db.add_all([alice, bob, charlie])
-        db.commit()
-        db.refresh(alice)
-        db.refresh(bob)
-        db.refresh(charlie)
-        print(f"✅ Created 3 users")
-        
-        # Create projects
-        print("Creating projects...")
-        backend_project = Project(
-            name="Backend API",
-            key="API",
-            description="REST API for IssueHub"
-        )
-        frontend_project = Project(
-            name="Frontend App",
-            key="FE",
-            description="React frontend application"
-        )
-        
-        db.add_all([backend_project, frontend_project])
-        db.commit()
-        db.refresh(backend_project)
-        db.refresh(frontend_project)
-        print(f"✅ Created 2 projects")
-        
-        # Add project members
-        print("Adding project members...")
-        members = [
-            ProjectMember(project_id=backend_project.id, user_id=alice.id, role=ProjectRole.MAINTAINER),
-            ProjectMember(project_id=backend_project.id, user_id=bob.id, role=ProjectRole.MEMBER),
-            ProjectMember(project_id=frontend_project.id, user_id=alice.id, role=ProjectRole.MEMBER),
-            ProjectMember(project_id=frontend_project.id, user_id=charlie.id, role=ProjectRole.MAINTAINER),
-        ]
-        db.add_all(members)
-        db.commit()
-        print(f"✅ Added project members")
-        
-        # Create issues
-        print("Creating issues...")
-        issues = [
-            # Backend issues
-            Issue(
-                project_id=backend_project.id,
-                title="Login endpoint returns 500 error",
-                description="When posting invalid credentials, should return 401 but returns 500",
-                status=IssueStatus.OPEN,
-                priority=IssuePriority.HIGH,
-                reporter_id=bob.id,
-                assignee_id=alice.id
-            ),
-            Issue(
-                project_id=backend_project.id,
-                title="Add pagination to issues list",
-                description="Currently returns all issues, need to add page/limit parameters",
-                status=IssueStatus.IN_PROGRESS,
-                priority=IssuePriority.MEDIUM,
-                reporter_id=alice.id,
-                assignee_id=alice.id
-            ),
-            Issue(
-                project_id=backend_project.id,
-                title="JWT tokens expire too quickly",
-                description="30 minutes is too short, should be at least 2 hours",
-                status=IssueStatus.RESOLVED,
-                priority=IssuePriority.LOW,
-                reporter_id=bob.id,
-                assignee_id=alice.id
-            ),
-            Issue(
-                project_id=backend_project.id,
-                title="Database connection pool exhausted",
-                description="Under heavy load, running out of database connections",
-                status=IssueStatus.OPEN,
-                priority=IssuePriority.CRITICAL,
-                reporter_id=alice.id,
-                assignee_id=None
-            ),
-            Issue(
-                project_id=backend_project.id,
-                title="Add input validation for email field",
-                description="Need to validate email format before saving to database",
-                status=IssueStatus.OPEN,
-                priority=IssuePriority.MEDIUM,
-                reporter_id=bob.id,
-                assignee_id=None
-            ),
-            # Frontend issues
-            Issue(
-                project_id=frontend_project.id,
-                title="Login button not centered on mobile",
-                description="Button alignment is off on screens smaller than 768px",
-                status=IssueStatus.OPEN,
-                priority=IssuePriority.LOW,
-                reporter_id=charlie.id,
-                assignee_id=None
-            ),
-            Issue(
-                project_id=frontend_project.id,
-                title="Issue list doesn't update after creating issue",
-                description="Need to refresh page to see newly created issues",
-                status=IssueStatus.IN_PROGRESS,
-                priority=IssuePriority.HIGH,
-                reporter_id=alice.id,
-                assignee_id=charlie.id
-            ),
-            Issue(
-                project_id=frontend_project.id,
-                title="Add loading spinners",
-                description="Show loading state when fetching data from API",
-                status=IssueStatus.RESOLVED,
-                priority=IssuePriority.MEDIUM,
-                reporter_id=charlie.id,
-                assignee_id=charlie.id
-            ),
-            Issue(
-                project_id=frontend_project.id,
-                title="Implement dark mode",
-                description="Add toggle for dark/light theme preference",
-                status=IssueStatus.OPEN,
-                priority=IssuePriority.LOW,
-                reporter_id=alice.id,
-                assignee_id=None
-            ),
-            Issue(
-                project_id=frontend_project.id,
-                title="Add toast notifications",
-                description="Show success/error messages for user actions",
-                status=IssueStatus.CLOSED,
-                priority=IssuePriority.HIGH,
-                reporter_id=charlie.id,
-                assignee_id=charlie.id
-            ),
-        ]
-        
-        db.add_all(issues)
-        db.commit()
-        
-        # Refresh to get IDs
-        for issue in issues:
-            db.refresh(issue)
-        
-        print(f"✅ Created {len(issues)} issues")
-        
-        # Create comments
-        print("Creating comments...")
-        comments = [
-            Comment(
-                issue_id=issues[0].id,
-                author_id=alice.id,
-                body="I'll look into this today. Probably missing error handling."
-            ),
-            Comment(
-                issue_id=issues[0].id,
-                author_id=bob.id,
-                body="Thanks! It's blocking our testing."
-            ),
-            Comment(
-                issue_id=issues[1].id,
-                author_id=alice.id,
-                body="Working on this now. Will use standard page/page_size params."
-            ),
-            Comment(
-                issue_id=issues[6].id,
-                author_id=charlie.id,
-                body="I think we need to invalidate the cache after POST requests."
-            ),
-            Comment(
-                issue_id=issues[6].id,
-                author_id=alice.id,
-                body="Good point! I'll add that to the fix."
-            ),
-            Comment(
-                issue_id=issues[9].id,
-                author_id=charlie.id,
-                body="Completed! Toast notifications are now working across the app."
-            ),
-        ]
-        
-        db.add_all(comments)
-        db.commit()
-        print(f"✅ Created {len(comments)} comments")
-        
+
+        # One Argon2 hash shared by all demo accounts: hashing is
+        # deliberately expensive (~100ms each), and these are throwaway
+        # credentials with the same password anyway
+        password_hash = get_password_hash("password123")
+
+        # Each table goes in as a single multi-row Core INSERT instead of
+        # one unit-of-work INSERT per instance: 5 statements total for the
+        # whole seed, with RETURNING collecting the generated ids in
+        # parameter order so later rows can reference them. The whole
+        # thing commits once via db.begin().
+        with db.begin():
+            # Create users
+            print("Creating users...")
+            alice_id, bob_id, charlie_id = db.execute(
+                insert(User).returning(User.id, sort_by_parameter_order=True),
+                [
+                    {"name": "Alice Johnson", "email": "alice@example.com", "password_hash": password_hash},
+                    {"name": "Bob Smith", "email": "bob@example.com", "password_hash": password_hash},
+                    {"name": "Charlie Davis", "email": "charlie@example.com", "password_hash": password_hash},
+                ],
+            ).scalars().all()
+            print(f"✅ Created 3 users")
+
+            # Create projects
+            print("Creating projects...")
+            backend_id, frontend_id = db.execute(
+                insert(Project).returning(Project.id, sort_by_parameter_order=True),
+                [
+                    {"name": "Backend API", "key": "API", "description": "REST API for IssueHub"},
+                    {"name": "Frontend App", "key": "FE", "description": "React frontend application"},
+                ],
+            ).scalars().all()
+            print(f"✅ Created 2 projects")
+
+            # Add project members
+            print("Adding project members...")
+            db.execute(
+                insert(ProjectMember),
+                [
+                    {"project_id": backend_id, "user_id": alice_id, "role": ProjectRole.MAINTAINER.value},
+                    {"project_id": backend_id, "user_id": bob_id, "role": ProjectRole.MEMBER.value},
+                    {"project_id": frontend_id, "user_id": alice_id, "role": ProjectRole.MEMBER.value},
+                    {"project_id": frontend_id, "user_id": charlie_id, "role": ProjectRole.MAINTAINER.value},
+                ],
+            )
+            print(f"✅ Added project members")
+
+            # Create issues
+            print("Creating issues...")
+            issues = [
+                # Backend issues
+                {
+                    "project_id": backend_id,
+                    "title": "Login endpoint returns 500 error",
+                    "description": "When posting invalid credentials, should return 401 but returns 500",
+                    "status": IssueStatus.OPEN.value,
+                    "priority": IssuePriority.HIGH.value,
+                    "reporter_id": bob_id,
+                    "assignee_id": alice_id,
+                },
+                {
+                    "project_id": backend_id,
+                    "title": "Add pagination to issues list",
+                    "description": "Currently returns all issues, need to add page/limit parameters",
+                    "status": IssueStatus.IN_PROGRESS.value,
+                    "priority": IssuePriority.MEDIUM.value,
+                    "reporter_id": alice_id,
+                    "assignee_id": alice_id,
+                },
+                {
+                    "project_id": backend_id,
+                    "title": "JWT tokens expire too quickly",
+                    "description": "30 minutes is too short, should be at least 2 hours",
+                    "status": IssueStatus.RESOLVED.value,
+                    "priority": IssuePriority.LOW.value,
+                    "reporter_id": bob_id,
+                    "assignee_id": alice_id,
+                },
+                {
+                    "project_id": backend_id,
+                    "title": "Database connection pool exhausted",
+                    "description": "Under heavy load, running out of database connections",
+                    "status": IssueStatus.OPEN.value,
+                    "priority": IssuePriority.CRITICAL.value,
+                    "reporter_id": alice_id,
+                    "assignee_id": None,
+                },
+                {
+                    "project_id": backend_id,
+                    "title": "Add input validation for email field",
+                    "description": "Need to validate email format before saving to database",
+                    "status": IssueStatus.OPEN.value,
+                    "priority": IssuePriority.MEDIUM.value,
+                    "reporter_id": bob_id,
+                    "assignee_id": None,
+                },
+                # Frontend issues
+                {
+                    "project_id": frontend_id,
+                    "title": "Login button not centered on mobile",
+                    "description": "Button alignment is off on screens smaller than 768px",
+                    "status": IssueStatus.OPEN.value,
+                    "priority": IssuePriority.LOW.value,
+                    "reporter_id": charlie_id,
+                    "assignee_id": None,
+                },
+                {
+                    "project_id": frontend_id,
+                    "title": "Issue list doesn't update after creating issue",
+                    "description": "Need to refresh page to see newly created issues",
+                    "status": IssueStatus.IN_PROGRESS.value,
+                    "priority": IssuePriority.HIGH.value,
+                    "reporter_id": alice_id,
+                    "assignee_id": charlie_id,
+                },
+                {
+                    "project_id": frontend_id,
+                    "title": "Add loading spinners",
+                    "description": "Show loading state when fetching data from API",
+                    "status": IssueStatus.RESOLVED.value,
+                    "priority": IssuePriority.MEDIUM.value,
+                    "reporter_id": charlie_id,
+                    "assignee_id": charlie_id,
+                },
+                {
+                    "project_id": frontend_id,
+                    "title": "Implement dark mode",
+                    "description": "Add toggle for dark/light theme preference",
+                    "status": IssueStatus.OPEN.value,
+                    "priority": IssuePriority.LOW.value,
+                    "reporter_id": alice_id,
+                    "assignee_id": None,
+                },
+                {
+                    "project_id": frontend_id,
+                    "title": "Add toast notifications",
+                    "description": "Show success/error messages for user actions",
+                    "status": IssueStatus.CLOSED.value,
+                    "priority": IssuePriority.HIGH.value,
+                    "reporter_id": charlie_id,
+                    "assignee_id": charlie_id,
+                },
+            ]
+
+            issue_ids = db.execute(
+                insert(Issue).returning(Issue.id, sort_by_parameter_order=True),
+                issues,
+            ).scalars().all()
+
+            print(f"✅ Created {len(issues)} issues")
+
+            # Create comments
+            print("Creating comments...")
+            comments = [
+                {
+                    "issue_id": issue_ids[0],
+                    "author_id": alice_id,
+                    "body": "I'll look into this today. Probably missing error handling.",
+                },
+                {
+                    "issue_id": issue_ids[0],
+                    "author_id": bob_id,
+                    "body": "Thanks! It's blocking our testing.",
+                },
+                {
+                    "issue_id": issue_ids[1],
+                    "author_id": alice_id,
+                    "body": "Working on this now. Will use standard page/page_size params.",
+                },
+                {
+                    "issue_id": issue_ids[6],
+                    "author_id": charlie_id,
+                    "body": "I think we need to invalidate the cache after POST requests.",
+                },
+                {
+                    "issue_id": issue_ids[6],
+                    "author_id": alice_id,
+                    "body": "Good point! I'll add that to the fix.",
+                },
+                {
+                    "issue_id": issue_ids[9],
+                    "author_id": charlie_id,
+                    "body": "Completed! Toast notifications are now working across the app.",
+                },
+            ]
+
+            db.execute(insert(Comment), comments)
+            print(f"✅ Created {len(comments)} comments")
+
         print("\n🎉 Database seeded successfully!")
         print("\n📝 Demo Credentials:")
         print("   Email: alice@example.com | Password: password123 (Backend Maintainer)")
         print("   Email: bob@example.com | Password: password123 (Backend Member)")
         print("   Email: charlie@example.com | Password: password123 (Frontend Maintainer)")
         print("\n🚀 You can now login with any of these accounts!")
-        
+
     except Exception as e:
         print(f"❌ Error seeding database: {e}")
         db.rollback()
@@ -238,4 +228,4 @@ def seed_database():
         db.close()
 
 if __name__ == "__main__":
-    seed_database()
\ No newline at end of file
+    seed_database()
@@ -11,79 +11,175 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 import pytest
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker, raiseload
+from sqlalchemy.pool import StaticPool
 from app.main import app
 from app.database import Base, get_db
 from app.core.security import get_password_hash
+from app.core.deps import clear_auth_caches
 
-# Use in-memory SQLite for testing (fast and isolated)
-SQLALCHEMY_DATABASE_URL = "sqlite:///./test.db"
+# In-memory SQLite shared across all sessions via StaticPool: no disk
+# I/O, no fsync, one connection for the whole suite. Under pytest-xdist
+# (pytest -n auto) each worker process imports this module separately
+# and therefore gets its own private in-memory database - no
+# worker_id-keyed URLs needed for isolation.
+SQLALCHEMY_DATABASE_URL = "sqlite://"
 
 engine = create_engine(
-    SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False}
+    SQLALCHEMY_DATABASE_URL,
+    connect_args={"check_same_thread": False},
+    poolclass=StaticPool,
 )
-TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# expire_on_commit=False matches the app's SessionLocal: fixture objects
+# stay readable after commit instead of re-SELECTing every column on the
+# next attribute access
+TestingSessionLocal = sessionmaker(
+    autocommit=False, autoflush=False, bind=engine, expire_on_commit=False
+)
+
+# pysqlite silently commits around SAVEPOINT statements unless driver-level
+# transaction handling is disabled and BEGIN is emitted explicitly - the
+# standard SQLAlchemy workaround, required for the savepoint-based test
+# isolation below. The pragma makes SQLite enforce foreign keys so the
+# ON DELETE CASCADE behavior the app relies on (passive_deletes) actually
+# fires where the tests run.
+@event.listens_for(engine, "connect")
+def _sqlite_configure_connection(dbapi_connection, connection_record):
+    dbapi_connection.isolation_level = None
+    dbapi_connection.execute("PRAGMA foreign_keys=ON")
+
+
+@event.listens_for(engine, "begin")
+def _sqlite_emit_begin(conn):
+    conn.exec_driver_sql("BEGIN")
+
+
+# Schema is created once per test run; per-test isolation comes from the
+# transaction rollback in the db fixture, not from create_all/drop_all
+# DDL around every test
+Base.metadata.create_all(bind=engine)
+
+
+def _forbid_lazy_loads(session):
+    """
+    Make any relationship lazy load fail the test instead of silently
+    issuing SQL. Routes are expected to eager-load (or batch-attach)
+    everything their response serializes; a test that trips this has
+    found an N+1 regression. sql_only leaves already-loaded attributes
+    readable, and explicit loader options at query sites still win over
+    the wildcard.
+    """
+    @event.listens_for(session, "do_orm_execute")
+    def _add_raiseload(execute_state):
+        if (
+            execute_state.is_select
+            and not execute_state.is_column_load
+            and not execute_state.is_relationship_load
+        ):
+            execute_state.statement = execute_state.statement.options(
+                raiseload("*", sql_only=True)
+            )
 
 
 @pytest.fixture(scope="function")
 def db():
-    """Create a fresh database for each test."""
-    Base.metadata.create_all(bind=engine)
-    db = TestingSessionLocal()
+    """
+    Provide a clean database state for each test.
+
+    The session joins an outer transaction on a dedicated connection;
+    commits inside the app become SAVEPOINT releases, and rolling the
+    outer transaction back at teardown wipes everything the test wrote
+    - no drop_all/create_all DDL per test.
+    """
+    # Auth caches must not leak users between per-test databases
+    clear_auth_caches()
+    connection = engine.connect()
+    transaction = connection.begin()
+    db = TestingSessionLocal(
+        bind=connection, join_transaction_mode="create_savepoint"
+    )
+    _forbid_lazy_loads(db)
     try:
         yield db
     finally:
         db.close()
-        Base.metadata.drop_all(bind=engine)
+        transaction.rollback()
+        connection.close()
+
+
+@pytest.fixture(scope="session")
+def _app_client():
+    """
+    One TestClient for the whole run. Entering the client fires the app's
+    startup hooks (thread pool sizing, pool warm-up), which is once-per-
+    process work - re-entering it per test just repeats that for no
+    isolation benefit, since per-test state lives in the db fixture.
+    """
+    with TestClient(app) as test_client:
+        yield test_client
 
 
 @pytest.fixture(scope="function")
-def client(db):
-    """FastAPI test client with test database."""
+def client(db, _app_client):
+    """FastAPI test client bound to this test's database session."""
     def override_get_db():
         try:
             yield db
         finally:
             pass
-    
+
     app.dependency_overrides[get_db] = override_get_db
-    with TestClient(app) as test_client:
-        yield test_client
+    yield _app_client
     app.dependency_overrides.clear()
 
 
+# Hash the test password once at import: Argon2 is ~100ms by design, and
+# test_user runs per test function. Every test user shares this hash;
+# login tests still verify against it normally.
+_TEST_PASSWORD = "testpass123"
+_TEST_PASSWORD_HASH = get_password_hash(_TEST_PASSWORD)
+
+
 @pytest.fixture
 def test_user(db):
     """Create a test user."""
     from app.models.user import User
-    
+
     user = User(
         name="Test User",
         email="test@example.com",
-        password_hash=get_password_hash("testpass123")
+        password_hash=_TEST_PASSWORD_HASH
     )
+    # flush() populates the autoincrement id; with expire_on_commit off
+    # there is nothing for a refresh SELECT to repopulate
     db.add(user)
+    db.flush()
     db.commit()
-    db.refresh(user)
-    
+
     return {
         "id": user.id,
         "name": user.name,
         "email": user.email,
-        "password": "testpass123"
+        "password": _TEST_PASSWORD
     }
 
 
+@pytest.fixture(scope="session")
+def _test_jwt():
+    """
+    One JWT for the whole run, minted directly instead of through
+    /api/auth/login. The login round-trip costs an Argon2 verify
+    (~100ms by design) per authed test; the token only carries the
+    test user's email, so there is nothing per-test about it. Login
+    itself is still exercised by the dedicated auth tests.
+    """
+    from app.core.security import create_access_token
+
+    return create_access_token(data={"sub": "test@example.com"})
+
+
 @pytest.fixture
-def auth_headers(client, test_user):
+def auth_headers(test_user, _test_jwt):
     """Get authentication headers with JWT token."""
-    response = client.post(
-        "/api/auth/login",
-        json={
-            "email": test_user["email"],
-            "password": test_user["password"]
-        }
-    )
-    token = response.json()["access_token"]
-    return {"Authorization": f"Bearer {token}"}
\ No newline at end of file
+    return {"Authorization": f"Bearer {_test_jwt}"}
\ No newline at end of file
@@ -9,80 +9,84 @@ import pytest
 @pytest.fixture
 def test_project(db, test_user):
     """Create a test project with test user as maintainer."""
+    from sqlalchemy import insert
     from app.models.project import Project, ProjectMember, ProjectRole
-    
-    project = Project(
-        name="Test Project",
-        key="TEST",
-        description="A test project"
-    )
-    db.add(project)
-    db.commit()
-    db.refresh(project)
-    
-    member = ProjectMember(
-        project_id=project.id,
-        user_id=test_user["id"],
-        role=ProjectRole.MAINTAINER
+
+    # Two Core INSERTs and one commit instead of the add/commit/refresh
+    # dance per object - same pattern the seed script uses
+    project_id = db.execute(
+        insert(Project).values(
+            name="Test Project",
+            key="TEST",
+            description="A test project"
+        ).returning(Project.id)
+    ).scalar_one()
+    db.execute(
+        insert(ProjectMember).values(
+            project_id=project_id,
+            user_id=test_user["id"],
+            role=ProjectRole.MAINTAINER.value
+        )
     )
-    db.add(member)
     db.commit()
-    
-    return project
+
+    return db.get(Project, project_id)
 
 
 @pytest.fixture
 def second_user(db):
     """Create a second test user."""
     from app.models.user import User
-    from app.core.security import get_password_hash
-    
+    from conftest import _TEST_PASSWORD_HASH
+
+    # Reuse the hash computed once in conftest - nothing logs in as this
+    # user, so the password behind the hash doesn't matter, and skipping
+    # Argon2 here saves ~100ms per test that uses the fixture
     user = User(
         name="Second User",
         email="second@example.com",
-        password_hash=get_password_hash("password123")
+        password_hash=_TEST_PASSWORD_HASH
     )
+    # flush() sets the id; no refresh SELECT needed with
+    # expire_on_commit=False
     db.add(user)
+    db.flush()
     db.commit()
-    db.refresh(user)
     return user
 
 
 # ==================== PROJECT TESTS ====================
 
-def test_create_project(client, auth_headers):
-    """Test creating a new project."""
+# One parametrized test for the create endpoint's outcomes: both cases
+# share the same fixture setup, so the variants amortize it instead of
+# paying it per test function
+@pytest.mark.parametrize("payload,expected_status", [
+    (
+        {"name": "New Project", "key": "NEW", "description": "Project description"},
+        201,
+    ),
+    (
+        # "TEST" collides with the test_project fixture's key
+        {"name": "Another Project", "key": "TEST", "description": "Description"},
+        400,
+    ),
+])
+def test_create_project_cases(client, auth_headers, test_project, payload, expected_status):
+    """Test creating a project: success and duplicate-key rejection."""
     response = client.post(
         "/api/projects",
         headers=auth_headers,
-        json={
-            "name": "New Project",
-            "key": "NEW",
-            "description": "Project description"
-        }
+        json=payload
     )
-    
-    assert response.status_code == 201
-    data = response.json()
-    assert data["name"] == "New Project"
-    assert data["key"] == "NEW"
-    assert data["description"] == "Project description"
 
-
-def test_create_project_duplicate_key(client, auth_headers, test_project):
-    """Test creating project with duplicate key fails."""
-    response = client.post(
-        "/api/projects",
-        headers=auth_headers,
-        json={
-            "name": "Another Project",
-            "key": test_project.key,  # Duplicate key
-            "description": "Description"
-        }
-    )
-    
-    assert response.status_code == 400
-    assert "already exists" in response.json()["detail"].lower()
+    assert response.status_code == expected_status
+    data = response.json()
+    if expected_status == 201:
+        assert data["name"] == payload["name"]
+        assert data["key"] == payload["key"]
+        assert data["description"] == payload["description"]
+    else:
+        assert "already exists" in data["detail"].lower()
 
 
 def test_list_projects(client, auth_headers, test_project):
@@ -110,6 +114,33 @@ def test_get_project_detail(client, auth_headers, test_project):
     assert "members" in data
 
 
+def test_get_project_detail_query_count(client, auth_headers, test_project):
+    """Project detail must serve from a fixed number of queries (no N+1)."""
+    from sqlalchemy import event
+    from conftest import engine
+
+    selects = []
+
+    def _count(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            selects.append(statement)
+
+    event.listen(engine, "before_cursor_execute", _count)
+    try:
+        response = client.get(
+            f"/api/projects/{test_project.id}",
+            headers=auth_headers
+        )
+    finally:
+        event.remove(engine, "before_cursor_execute", _count)
+
+    assert response.status_code == 200
+    # auth user lookup + project/membership join + batched members load
+    # (member users ride along via joinedload). More than that means a
+    # per-member lazy load crept back in.
+    assert len(selects) <= 3
+
+
 def test_add_project_member(client, auth_headers, test_project, second_user):
     """Test adding a member to project (maintainer only)."""
     response = client.post(
@@ -127,6 +158,41 @@ def test_add_project_member(client, auth_headers, test_project, second_user):
     assert data["role"] == "member"
 
 
+def test_delete_issue_cascades_comments(client, auth_headers, db, test_user, test_project):
+    """Deleting an issue must delete its comments via the FK cascade."""
+    from sqlalchemy import func, insert, select
+    from app.models.comment import Comment
+    from app.models.issue import Issue
+
+    issue_id = db.execute(
+        insert(Issue).values(
+            project_id=test_project.id,
+            title="Issue with a comment",
+            status="open",
+            priority="medium",
+            reporter_id=test_user["id"]
+        ).returning(Issue.id)
+    ).scalar_one()
+    db.execute(
+        insert(Comment).values(
+            issue_id=issue_id,
+            author_id=test_user["id"],
+            body="About to be cascaded away"
+        )
+    )
+    db.commit()
+
+    response = client.delete(f"/api/issues/{issue_id}", headers=auth_headers)
+
+    assert response.status_code == 204
+    # passive_deletes hands cleanup to ON DELETE CASCADE - an orphaned
+    # comment here means foreign keys aren't being enforced
+    remaining = db.execute(
+        select(func.count()).select_from(Comment).where(Comment.issue_id == issue_id)
+    ).scalar_one()
+    assert remaining == 0
+
+
 def test_add_member_nonexistent_user(client, auth_headers, test_project):
     """Test adding non-existent user fails."""
     response = client.post(